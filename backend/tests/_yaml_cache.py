@@ -0,0 +1,51 @@
+"""
+Cached YAML loading for tests that inspect repository config files.
+
+Parsed documents are kept per path and reused until the file's mtime or
+size changes. Callers receive a deep copy so they cannot mutate the cache.
+"""
+
+import copy
+import os
+from collections import OrderedDict
+from typing import Any
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# Maximum number of parsed files kept in memory
+_MAX_ENTRIES = 100
+
+# path -> (mtime, size, parsed document)
+_CACHE: "OrderedDict[str, tuple[float, int, Any]]" = OrderedDict()
+
+
+def load_yaml_cached(path: str) -> Any:
+    """
+    Load a YAML file, reusing the parsed result while the file is unchanged.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        A deep copy of the parsed document
+    """
+    stat = os.stat(path)
+    hit = _CACHE.get(path)
+    if hit is not None and hit[0] == stat.st_mtime and hit[1] == stat.st_size:
+        _CACHE.move_to_end(path)
+        return copy.deepcopy(hit[2])
+
+    with open(path, "r") as f:
+        data = yaml.load(f, Loader=_Loader)
+
+    _CACHE[path] = (stat.st_mtime, stat.st_size, data)
+    _CACHE.move_to_end(path)
+    if len(_CACHE) > _MAX_ENTRIES:
+        _CACHE.popitem(last=False)
+
+    return copy.deepcopy(data)
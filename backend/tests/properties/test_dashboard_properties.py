@@ -13,7 +13,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 import uuid
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from typing import Any
 
 import pytest
@@ -358,7 +358,6 @@ class TestChartDataDateRangeProperties:
             current_date += timedelta(days=1)
         
         # Verify start date
-        from datetime import date
         first_date = date.fromisoformat(data_points[0]["date"])
         assert first_date == expected_start_date
 
@@ -386,7 +385,6 @@ class TestChartDataDateRangeProperties:
             current_date += timedelta(days=1)
         
         # Verify end date
-        from datetime import date
         last_date = date.fromisoformat(data_points[-1]["date"])
         assert last_date == end_date
 
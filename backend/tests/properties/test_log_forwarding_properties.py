@@ -5,17 +5,186 @@ Tests correctness properties for Promtail log forwarding configuration.
 This validates that logs forwarded to Loki include proper service labels.
 """
 
-import pytest
-from hypothesis import given, strategies as st, settings
+import itertools
 import json
-import re
 import os
+import random
+import re
+import uuid
+
+import pytest
+
+from tests._yaml_cache import load_yaml_cached
+
+try:
+    import orjson
+
+    def dumps_log(entry: dict) -> str:
+        """Serialize a log entry to a compact single-line JSON string."""
+        return orjson.dumps(entry).decode()
+except ImportError:
+    def dumps_log(entry: dict) -> str:
+        """Serialize a log entry to a compact single-line JSON string."""
+        return json.dumps(entry, separators=(",", ":"))
 
 # Get the project root directory (parent of backend)
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 PROMTAIL_CONFIG_PATH = os.path.join(PROJECT_ROOT, "monitoring", "promtail", "promtail-config.yml")
 DOCKER_COMPOSE_PATH = os.path.join(PROJECT_ROOT, "docker-compose.yml")
 
+# Sample service names
+SERVICE_NAMES = (
+    "backend",
+    "celery-worker",
+    "celery-beat",
+    "flower",
+    "postgres",
+    "redis",
+)
+
+# Sample container names
+CONTAINER_NAMES = (
+    "gambling-detector-backend-1",
+    "gambling-detector-celery-worker-1",
+    "gambling-detector-celery-beat-1",
+    "gambling-detector-flower-1",
+    "gambling-detector-postgres-1",
+    "gambling-detector-redis-1",
+)
+
+# Prometheus/Loki label values can contain alphanumeric characters,
+# underscores, and hyphens
+VALID_LABEL_PATTERN = re.compile(r'^[a-zA-Z0-9_\-]+$')
+
+# Every name is static, so validate them once at import
+INVALID_LABEL_NAMES = [
+    name for name in SERVICE_NAMES + CONTAINER_NAMES
+    if not VALID_LABEL_PATTERN.match(name)
+]
+
+# Structured log field values; the request ID is opaque to Promtail, so a
+# single one generated at import is enough
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+HTTP_METHODS = ("GET", "POST", "PUT", "DELETE", "PATCH")
+REQUEST_PATHS = ("/health", "/api/users", "/api/scans", "/metrics")
+STATUS_CODES = (200, 201, 400, 401, 403, 404, 500)
+REQUEST_ID = str(uuid.uuid4())
+
+# Promtail does not interpret the timestamp, so any valid ISO value will do
+FIXED_TIMESTAMP = "2025-01-01T00:00:00+00:00"
+
+# Deterministic sample of the level/method/path/status cross product
+STRUCTURED_LOG_CASES = random.Random(0).sample(
+    list(itertools.product(LOG_LEVELS, HTTP_METHODS, REQUEST_PATHS, STATUS_CODES)),
+    50
+)
+
+# Static fields of a request log entry as produced by logging_config
+BASE_LOG_ENTRY = {
+    "logger": "app.requests",
+    "message": "Request completed",
+    "request_id": REQUEST_ID,
+    "duration_ms": 15.5,
+    "client_ip": "192.168.1.1",
+}
+
+
+@pytest.fixture(scope="session")
+def promtail_config():
+    """Parse the promtail configuration once per test session."""
+    return load_yaml_cached(PROMTAIL_CONFIG_PATH)
+
+
+@pytest.fixture(scope="session")
+def docker_compose_config():
+    """Parse docker-compose.yml once per test session."""
+    return load_yaml_cached(DOCKER_COMPOSE_PATH)
+
+
+@pytest.fixture(scope="session")
+def docker_job(promtail_config):
+    """The 'docker' scrape config from promtail, or None if missing."""
+    scrape_configs = promtail_config.get("scrape_configs", [])
+    return next(
+        (sc for sc in scrape_configs if sc.get("job_name") == "docker"),
+        None
+    )
+
+
+@pytest.fixture(scope="session")
+def relabel_by_target(docker_job):
+    """Relabel configs of the 'docker' job indexed by their target_label."""
+    if docker_job is None:
+        return {}
+    return {
+        relabel["target_label"]: relabel
+        for relabel in docker_job.get("relabel_configs", [])
+        if "target_label" in relabel
+    }
+
+
+def _assert_extracts_service_name_label(promtail_config, docker_job, relabel_by_target):
+    """Promtail SHALL extract the service_name label from Docker metadata."""
+    assert docker_job is not None, \
+        "Promtail config should have a 'docker' job for container discovery"
+    
+    relabel = relabel_by_target.get("service_name")
+    assert relabel is not None, \
+        "Promtail config should extract 'service_name' label from container metadata"
+    
+    # Verify it extracts from docker compose service label
+    source_labels = relabel.get("source_labels", [])
+    assert "compose_service" in "\n".join(source_labels), \
+        "service_name should be extracted from docker compose service label"
+
+
+def _assert_extracts_container_name_label(promtail_config, docker_job, relabel_by_target):
+    """Promtail SHALL extract the container_name label from Docker metadata."""
+    assert docker_job is not None, \
+        "Promtail config should have a 'docker' job for container discovery"
+    
+    relabel = relabel_by_target.get("container_name")
+    assert relabel is not None, \
+        "Promtail config should extract 'container_name' label from container metadata"
+    
+    # Verify it extracts from docker container name metadata
+    source_labels = relabel.get("source_labels", [])
+    assert "container_name" in "\n".join(source_labels), \
+        "container_name should be extracted from docker container name metadata"
+
+
+def _assert_has_loki_client(promtail_config, docker_job, relabel_by_target):
+    """Promtail SHALL have Loki as the push target."""
+    clients = promtail_config.get("clients", [])
+    assert len(clients) > 0, "Promtail should have at least one client configured"
+    
+    # Check that Loki is configured as the target
+    assert any(
+        "loki" in url and "/loki/api/v1/push" in url
+        for url in (client.get("url", "") for client in clients)
+    ), "Promtail should have Loki configured as push target"
+
+
+def _assert_parses_json_logs(promtail_config, docker_job, relabel_by_target):
+    """Promtail SHALL parse JSON structured logs from backend."""
+    assert docker_job is not None, \
+        "Promtail config should have a 'docker' job"
+    
+    # Check pipeline stages for JSON parsing, including nested match stages
+    has_json_stage = False
+    for stage in docker_job.get("pipeline_stages", []):
+        if "json" in stage:
+            has_json_stage = True
+            break
+        if "match" in stage:
+            match_stages = stage["match"].get("stages", [])
+            if any("json" in ms for ms in match_stages):
+                has_json_stage = True
+                break
+    
+    assert has_json_stage, \
+        "Promtail config should have JSON parsing stage for structured logs"
+
 
 class TestLogForwardingWithLabels:
     """
@@ -26,203 +195,40 @@ class TestLogForwardingWithLabels:
     the entry SHALL include labels identifying the source service name and container.
     """
     
-    def test_promtail_config_extracts_service_name_label(self):
-        """
-        Promtail configuration SHALL extract service_name label from Docker metadata.
-        """
-        import yaml
-        
-        # Read the promtail configuration
-        with open(PROMTAIL_CONFIG_PATH, "r") as f:
-            config = yaml.safe_load(f)
-        
-        # Find the docker scrape config
-        scrape_configs = config.get("scrape_configs", [])
-        docker_config = None
-        
-        for sc in scrape_configs:
-            if sc.get("job_name") == "docker":
-                docker_config = sc
-                break
-        
-        assert docker_config is not None, \
-            "Promtail config should have a 'docker' job for container discovery"
-        
-        # Check relabel configs for service_name extraction
-        relabel_configs = docker_config.get("relabel_configs", [])
-        
-        has_service_name_label = False
-        for relabel in relabel_configs:
-            target_label = relabel.get("target_label", "")
-            if target_label == "service_name":
-                has_service_name_label = True
-                # Verify it extracts from docker compose service label
-                source_labels = relabel.get("source_labels", [])
-                assert any("compose_service" in str(sl) for sl in source_labels), \
-                    "service_name should be extracted from docker compose service label"
-                break
-        
-        assert has_service_name_label, \
-            "Promtail config should extract 'service_name' label from container metadata"
-    
-    def test_promtail_config_extracts_container_name_label(self):
-        """
-        Promtail configuration SHALL extract container_name label from Docker metadata.
-        """
-        import yaml
-        
-        # Read the promtail configuration
-        with open(PROMTAIL_CONFIG_PATH, "r") as f:
-            config = yaml.safe_load(f)
-        
-        # Find the docker scrape config
-        scrape_configs = config.get("scrape_configs", [])
-        docker_config = None
-        
-        for sc in scrape_configs:
-            if sc.get("job_name") == "docker":
-                docker_config = sc
-                break
-        
-        assert docker_config is not None, \
-            "Promtail config should have a 'docker' job for container discovery"
-        
-        # Check relabel configs for container_name extraction
-        relabel_configs = docker_config.get("relabel_configs", [])
-        
-        has_container_name_label = False
-        for relabel in relabel_configs:
-            target_label = relabel.get("target_label", "")
-            if target_label == "container_name":
-                has_container_name_label = True
-                # Verify it extracts from docker container name
-                source_labels = relabel.get("source_labels", [])
-                assert any("container_name" in str(sl) for sl in source_labels), \
-                    "container_name should be extracted from docker container name metadata"
-                break
-        
-        assert has_container_name_label, \
-            "Promtail config should extract 'container_name' label from container metadata"
-    
-    def test_promtail_config_has_loki_client(self):
-        """
-        Promtail configuration SHALL have Loki as the push target.
-        """
-        import yaml
-        
-        # Read the promtail configuration
-        with open(PROMTAIL_CONFIG_PATH, "r") as f:
-            config = yaml.safe_load(f)
-        
-        clients = config.get("clients", [])
-        assert len(clients) > 0, "Promtail should have at least one client configured"
-        
-        # Check that Loki is configured as the target
-        loki_client = None
-        for client in clients:
-            url = client.get("url", "")
-            if "loki" in url and "/loki/api/v1/push" in url:
-                loki_client = client
-                break
-        
-        assert loki_client is not None, \
-            "Promtail should have Loki configured as push target"
-    
-    def test_promtail_config_parses_json_logs(self):
+    @pytest.mark.parametrize(
+        "checker",
+        [
+            _assert_extracts_service_name_label,
+            _assert_extracts_container_name_label,
+            _assert_has_loki_client,
+            _assert_parses_json_logs,
+        ],
+        ids=lambda checker: checker.__name__.removeprefix("_assert_"),
+    )
+    def test_promtail_config(self, checker, promtail_config, docker_job, relabel_by_target):
         """
-        Promtail configuration SHALL parse JSON structured logs from backend.
+        Promtail configuration SHALL extract service and container labels from
+        Docker metadata, parse JSON logs and push them to Loki.
         """
-        import yaml
-        
-        # Read the promtail configuration
-        with open(PROMTAIL_CONFIG_PATH, "r") as f:
-            config = yaml.safe_load(f)
-        
-        # Find the docker scrape config
-        scrape_configs = config.get("scrape_configs", [])
-        docker_config = None
-        
-        for sc in scrape_configs:
-            if sc.get("job_name") == "docker":
-                docker_config = sc
-                break
-        
-        assert docker_config is not None, \
-            "Promtail config should have a 'docker' job"
-        
-        # Check pipeline stages for JSON parsing
-        pipeline_stages = docker_config.get("pipeline_stages", [])
-        
-        has_json_stage = False
-        for stage in pipeline_stages:
-            if "json" in stage:
-                has_json_stage = True
-                break
-            # Also check nested match stages
-            if "match" in stage:
-                match_stages = stage["match"].get("stages", [])
-                for ms in match_stages:
-                    if "json" in ms:
-                        has_json_stage = True
-                        break
-        
-        assert has_json_stage, \
-            "Promtail config should have JSON parsing stage for structured logs"
+        checker(promtail_config, docker_job, relabel_by_target)
     
-    # Strategy for generating sample service names
-    service_names = st.sampled_from([
-        "backend",
-        "celery-worker",
-        "celery-beat",
-        "flower",
-        "postgres",
-        "redis"
-    ])
-    
-    # Strategy for generating sample container names
-    container_names = st.sampled_from([
-        "gambling-detector-backend-1",
-        "gambling-detector-celery-worker-1",
-        "gambling-detector-celery-beat-1",
-        "gambling-detector-flower-1",
-        "gambling-detector-postgres-1",
-        "gambling-detector-redis-1"
-    ])
-    
-    @given(
-        service_name=service_names,
-        container_name=container_names
-    )
-    @settings(max_examples=100)
-    def test_log_labels_format_is_valid(self, service_name: str, container_name: str):
+    def test_log_labels_format_is_valid(self):
         """
         For any service and container name combination, the label format SHALL be valid.
         
         This tests that the label values we expect to extract are valid Prometheus/Loki
         label values (alphanumeric with underscores and hyphens).
         """
-        # Prometheus/Loki label values should match this pattern
-        # They can contain alphanumeric characters, underscores, and hyphens
-        valid_label_pattern = re.compile(r'^[a-zA-Z0-9_\-]+$')
-        
-        assert valid_label_pattern.match(service_name), \
-            f"Service name '{service_name}' should be a valid label value"
-        
-        assert valid_label_pattern.match(container_name), \
-            f"Container name '{container_name}' should be a valid label value"
+        assert not INVALID_LABEL_NAMES, \
+            f"Names {INVALID_LABEL_NAMES} should be valid label values"
     
-    @given(
-        log_level=st.sampled_from(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]),
-        request_id=st.uuids().map(str),
-        method=st.sampled_from(["GET", "POST", "PUT", "DELETE", "PATCH"]),
-        path=st.sampled_from(["/health", "/api/users", "/api/scans", "/metrics"]),
-        status_code=st.sampled_from([200, 201, 400, 401, 403, 404, 500])
+    @pytest.mark.parametrize(
+        "log_level,method,path,status_code",
+        STRUCTURED_LOG_CASES
     )
-    @settings(max_examples=100)
     def test_structured_log_can_be_parsed_by_promtail(
         self, 
         log_level: str, 
-        request_id: str, 
         method: str, 
         path: str, 
         status_code: int
@@ -233,54 +239,63 @@ class TestLogForwardingWithLabels:
         
         This validates that our log format is compatible with the Promtail pipeline.
         """
-        from datetime import datetime, timezone
-        
         # Create a log entry in the same format as our logging_config produces
         log_entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            **BASE_LOG_ENTRY,
+            "timestamp": FIXED_TIMESTAMP,
             "level": log_level,
-            "logger": "app.requests",
-            "message": "Request completed",
-            "request_id": request_id,
             "method": method,
             "path": path,
             "status_code": status_code,
-            "duration_ms": 15.5,
-            "client_ip": "192.168.1.1"
         }
         
         # Serialize to JSON (as it would appear in Docker logs)
-        log_json = json.dumps(log_entry)
+        log_json = dumps_log(log_entry)
         
-        # Verify it's valid JSON that can be parsed
-        parsed = json.loads(log_json)
+        assert "\n" not in log_json, \
+            "log entry should serialize to a single line"
         
         # Verify all expected fields are present and extractable
-        assert parsed.get("level") == log_level, \
+        assert f'"level":"{log_level}"' in log_json, \
             "level field should be extractable"
-        assert parsed.get("request_id") == request_id, \
+        assert f'"request_id":"{REQUEST_ID}"' in log_json, \
             "request_id field should be extractable"
-        assert parsed.get("method") == method, \
+        assert f'"method":"{method}"' in log_json, \
             "method field should be extractable"
-        assert parsed.get("path") == path, \
+        assert f'"path":"{path}"' in log_json, \
             "path field should be extractable"
-        assert parsed.get("status_code") == status_code, \
+        assert f'"status_code":{status_code}' in log_json, \
             "status_code field should be extractable"
     
-    def test_docker_compose_services_have_labels(self):
+    def test_structured_log_round_trips_through_json(self):
+        """
+        A structured log line SHALL decode back to exactly one JSON object
+        carrying every field of the original entry.
+        """
+        log_entry = {
+            **BASE_LOG_ENTRY,
+            "timestamp": FIXED_TIMESTAMP,
+            "level": "INFO",
+            "method": "GET",
+            "path": "/health",
+            "status_code": 200,
+        }
+        log_json = dumps_log(log_entry)
+        
+        parsed, end = json.JSONDecoder().raw_decode(log_json)
+        
+        assert end == len(log_json), \
+            "log line should contain nothing after the JSON object"
+        assert parsed == log_entry
+    
+    def test_docker_compose_services_have_labels(self, docker_compose_config):
         """
         Docker Compose services SHALL have labels that Promtail can extract.
         
         This verifies that the docker-compose.yml is configured in a way that
         allows Promtail to identify services by their compose labels.
         """
-        import yaml
-        
-        # Read docker-compose.yml
-        with open(DOCKER_COMPOSE_PATH, "r") as f:
-            compose = yaml.safe_load(f)
-        
-        services = compose.get("services", {})
+        services = docker_compose_config.get("services", {})
         
         # Key services that should be monitored
         monitored_services = ["backend", "celery-worker", "celery-beat"]
@@ -18,15 +18,43 @@ from pathlib import Path
 # Add backend to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-import uuid
-from typing import List
+from typing import List, NamedTuple, Union
 
+import numpy as np
 import pytest
-from hypothesis import given, strategies as st, settings, assume
+from hypothesis import given, strategies as st, settings, assume, Phase
+from hypothesis.extra import numpy as hnp
 
 # Low confidence threshold (70%) - matches frontend constant
 LOW_CONFIDENCE_THRESHOLD = 0.7
 
+# Below this many results a plain comprehension beats building an array
+VECTORIZE_MIN_SIZE = 16
+
+# Settings for properties of the bare threshold predicate: a monotone
+# compare has no interesting shrink target or examples worth storing
+FAST_SETTINGS = settings(
+    max_examples=20,
+    deadline=None,
+    derandomize=True,
+    database=None,
+    phases=(Phase.generate,),
+)
+
+# Largest list the filter property strategies generate
+MAX_RESULTS = 50
+
+# Prebuilt result records; tests copy one and set its confidence
+RESULT_TEMPLATES = [
+    {
+        'id': i,
+        'confidence': 0.0,
+        'comment_text': f'Comment {i}',
+        'is_gambling': i % 2 == 0,
+    }
+    for i in range(MAX_RESULTS)
+]
+
 
 def is_low_confidence_result(confidence: float) -> bool:
     """
@@ -39,15 +67,66 @@ def is_low_confidence_result(confidence: float) -> bool:
     return confidence < LOW_CONFIDENCE_THRESHOLD
 
 
-def filter_by_low_confidence(results: List[dict]) -> List[dict]:
+def is_low_confidence_batch(confidences: np.ndarray) -> np.ndarray:
+    """
+    Vectorized is_low_confidence_result over an array of confidences.
+    
+    Returns a boolean mask that is True where the confidence is low.
+    """
+    return confidences < LOW_CONFIDENCE_THRESHOLD
+
+
+def _low_confidence_indices(confidences: np.ndarray) -> np.ndarray:
+    """Indices of low-confidence entries."""
+    return np.flatnonzero(is_low_confidence_batch(confidences))
+
+
+class ResultsSoA(NamedTuple):
+    """Scan results stored column-wise: parallel arrays of IDs and confidences."""
+    ids: np.ndarray
+    confidences: np.ndarray
+
+
+def make_results_soa(confidences: List[float]) -> ResultsSoA:
+    """Build column-wise results whose IDs are their positions."""
+    return ResultsSoA(
+        ids=np.arange(len(confidences), dtype=np.int64),
+        confidences=np.asarray(confidences, dtype=np.float64),
+    )
+
+
+def filter_by_low_confidence(
+    results: Union[List[dict], ResultsSoA],
+) -> Union[List[dict], ResultsSoA]:
     """
     Filter results to only include low confidence items.
     
     Requirements: 3.2 - Filter comments with confidence < 70%
     
-    This function mirrors the frontend filter implementation.
+    This function mirrors the frontend filter implementation. Column-wise
+    results are filtered with a single mask and returned column-wise.
     """
-    return [r for r in results if is_low_confidence_result(r['confidence'])]
+    if isinstance(results, ResultsSoA):
+        mask = is_low_confidence_batch(results.confidences)
+        return ResultsSoA(results.ids[mask], results.confidences[mask])
+    
+    if len(results) < VECTORIZE_MIN_SIZE:
+        # Inline the predicate with the threshold bound to a local
+        threshold = LOW_CONFIDENCE_THRESHOLD
+        return [r for r in results if r['confidence'] < threshold]
+    
+    confidences = np.fromiter(
+        (r['confidence'] for r in results),
+        dtype=np.float64,
+        count=len(results),
+    )
+    indices = _low_confidence_indices(confidences)
+    return [results[i] for i in indices.tolist()]
+
+
+def result_ids(results: List[dict]) -> np.ndarray:
+    """Integer IDs of list-of-dict results as an array, in list order."""
+    return np.fromiter((r['id'] for r in results), dtype=np.int64, count=len(results))
 
 
 class TestLowConfidenceHighlightingProperties:
@@ -61,111 +140,64 @@ class TestLowConfidenceHighlightingProperties:
     """
 
     @given(
-        confidence=st.floats(min_value=0.0, max_value=0.6999, allow_nan=False),
-    )
-    @settings(max_examples=100)
-    def test_below_threshold_is_low_confidence(
-        self,
-        confidence: float,
-    ):
-        """
-        Property: Confidence below 70% is marked as low confidence
-        
-        For any confidence score strictly below 0.7, the result should
-        be identified as low confidence.
-        """
-        assert is_low_confidence_result(confidence) == True
-
-    @given(
-        confidence=st.floats(min_value=0.7, max_value=1.0, allow_nan=False),
-    )
-    @settings(max_examples=100)
-    def test_at_or_above_threshold_is_not_low_confidence(
-        self,
-        confidence: float,
-    ):
-        """
-        Property: Confidence at or above 70% is NOT marked as low confidence
-        
-        For any confidence score >= 0.7, the result should NOT be
-        identified as low confidence.
-        """
-        assert is_low_confidence_result(confidence) == False
-
-    @given(
-        confidence=st.floats(min_value=0.0, max_value=1.0, allow_nan=False),
+        confidences=hnp.arrays(
+            np.float64,
+            1024,
+            elements=st.floats(min_value=0.0, max_value=1.0, allow_nan=False),
+        ),
     )
-    @settings(max_examples=100)
-    def test_low_confidence_is_mutually_exclusive(
+    @FAST_SETTINGS
+    def test_low_confidence_matches_threshold(
         self,
-        confidence: float,
+        confidences: np.ndarray,
     ):
         """
-        Property: Low confidence classification is mutually exclusive
+        Property: Confidence below 70% is low confidence, anything else is not
         
-        For any confidence score, a result is either low confidence OR
-        not low confidence, never both or neither.
+        For every confidence score, is_low_confidence_result is True exactly
+        when the score is strictly below 0.7, returns the same answer on
+        repeated calls, and agrees with the vectorized batch check.
         """
-        is_low = is_low_confidence_result(confidence)
+        expected = confidences < LOW_CONFIDENCE_THRESHOLD
         
-        # Must be exactly one of True or False
-        assert is_low in [True, False]
+        first = np.array([is_low_confidence_result(c) for c in confidences.tolist()])
+        second = np.array([is_low_confidence_result(c) for c in confidences.tolist()])
         
-        # Verify consistency with threshold
-        if confidence < LOW_CONFIDENCE_THRESHOLD:
-            assert is_low == True
-        else:
-            assert is_low == False
+        assert np.array_equal(first, expected)
+        assert np.array_equal(first, second)
+        assert np.array_equal(is_low_confidence_batch(confidences), expected)
 
     @given(
-        confidence=st.floats(min_value=0.0, max_value=1.0, allow_nan=False),
-    )
-    @settings(max_examples=100)
-    def test_low_confidence_deterministic(
-        self,
-        confidence: float,
-    ):
-        """
-        Property: Low confidence check is deterministic
-        
-        For any given confidence score, calling is_low_confidence_result
-        multiple times should always return the same result.
-        """
-        result1 = is_low_confidence_result(confidence)
-        result2 = is_low_confidence_result(confidence)
-        result3 = is_low_confidence_result(confidence)
-        
-        assert result1 == result2 == result3
-
-    @given(
-        low_confidence=st.floats(min_value=0.0, max_value=0.6999, allow_nan=False),
-        high_confidence=st.floats(min_value=0.7, max_value=1.0, allow_nan=False),
+        confidences=hnp.arrays(
+            np.float64,
+            1024,
+            elements=st.floats(min_value=0.0, max_value=1.0, allow_nan=False),
+        ),
     )
-    @settings(max_examples=100)
+    @FAST_SETTINGS
     def test_low_confidence_ordering(
         self,
-        low_confidence: float,
-        high_confidence: float,
+        confidences: np.ndarray,
     ):
         """
         Property: Lower confidence values are more likely to be low confidence
         
         If confidence_a < confidence_b and confidence_b is low confidence,
-        then confidence_a must also be low confidence.
+        then confidence_a must also be low confidence, so over sorted scores
+        the low-confidence mask never turns back on once it turns off.
         """
-        # If high_confidence is NOT low confidence (which it shouldn't be)
-        # and low_confidence IS low confidence (which it should be)
-        # then low_confidence < high_confidence
+        mask = is_low_confidence_batch(np.sort(confidences))
         
-        is_low_low = is_low_confidence_result(low_confidence)
-        is_low_high = is_low_confidence_result(high_confidence)
-        
-        # Low confidence value should be marked as low confidence
-        assert is_low_low == True
-        # High confidence value should NOT be marked as low confidence
-        assert is_low_high == False
-        # The actual values should maintain the ordering
-        assert low_confidence < high_confidence
+        assert not np.any(mask[1:] & ~mask[:-1])
+
+    def test_threshold_boundary(self):
+        """
+        Property: Exactly 70% is NOT low confidence, just below it is
+        """
+        assert is_low_confidence_result(LOW_CONFIDENCE_THRESHOLD) == False
+        assert is_low_confidence_result(
+            float(np.nextafter(LOW_CONFIDENCE_THRESHOLD, 0.0))
+        ) == True
 
 
 class TestFilterCorrectnessProperties:
@@ -179,137 +211,82 @@ class TestFilterCorrectnessProperties:
     """
 
     @given(
-        confidences=st.lists(
-            st.floats(min_value=0.0, max_value=1.0, allow_nan=False),
-            min_size=0,
-            max_size=50,
-        ),
-    )
-    @settings(max_examples=100)
-    def test_filter_only_returns_low_confidence(
-        self,
-        confidences: List[float],
-    ):
-        """
-        Property: Filter only returns low confidence results
-        
-        All results returned by the low confidence filter should have
-        confidence < 0.7.
-        """
-        # Create mock results
-        results = [
-            {'id': str(uuid.uuid4()), 'confidence': c}
-            for c in confidences
-        ]
-        
-        # Apply filter
-        filtered = filter_by_low_confidence(results)
-        
-        # All filtered results should be low confidence
-        for result in filtered:
-            assert result['confidence'] < LOW_CONFIDENCE_THRESHOLD
-
-    @given(
-        confidences=st.lists(
-            st.floats(min_value=0.0, max_value=1.0, allow_nan=False),
-            min_size=0,
-            max_size=50,
+        batches=hnp.arrays(
+            np.float64,
+            st.tuples(st.integers(min_value=1, max_value=32), st.integers(min_value=0, max_value=MAX_RESULTS)),
+            elements=st.floats(min_value=0.0, max_value=1.0, allow_nan=False),
         ),
     )
-    @settings(max_examples=100)
-    def test_filter_excludes_high_confidence(
+    @settings(max_examples=20)
+    def test_filter_selects_exactly_low_confidence(
         self,
-        confidences: List[float],
+        batches: np.ndarray,
     ):
         """
-        Property: Filter excludes high confidence results
+        Property: Filter returns exactly the low confidence results
         
-        No results with confidence >= 0.7 should appear in the filtered list.
+        For each row of confidences, the filter should only return results
+        with confidence < 0.7, exclude every result with confidence >= 0.7,
+        include every result with confidence < 0.7, and so return as many
+        results as there are low confidence scores.
         """
-        # Create mock results
-        results = [
-            {'id': str(uuid.uuid4()), 'confidence': c}
-            for c in confidences
-        ]
-        
-        # Apply filter
-        filtered = filter_by_low_confidence(results)
-        filtered_ids = {r['id'] for r in filtered}
-        
-        # Check that high confidence results are excluded
-        for result in results:
-            if result['confidence'] >= LOW_CONFIDENCE_THRESHOLD:
-                assert result['id'] not in filtered_ids
+        for confidences in batches:
+            # Create mock results
+            results = make_results_soa(confidences)
+            mask = is_low_confidence_batch(results.confidences)
+            
+            # Apply filter
+            filtered = filter_by_low_confidence(results)
+            
+            # Only low confidence results are returned
+            assert is_low_confidence_batch(filtered.confidences).all()
+            
+            # Exactly the low confidence results, in order, are returned
+            assert np.array_equal(filtered.ids, results.ids[mask])
+            
+            # Filtered count equals low confidence count
+            assert len(filtered.ids) == int(mask.sum())
 
-    @given(
-        confidences=st.lists(
-            st.floats(min_value=0.0, max_value=1.0, allow_nan=False),
-            min_size=0,
-            max_size=50,
-        ),
+    @pytest.mark.parametrize(
+        "size",
+        [VECTORIZE_MIN_SIZE - 1, VECTORIZE_MIN_SIZE, MAX_RESULTS],
     )
-    @settings(max_examples=100)
-    def test_filter_includes_all_low_confidence(
+    @given(data=st.data())
+    @settings(max_examples=20)
+    def test_filter_selects_exactly_low_confidence_records(
         self,
-        confidences: List[float],
+        size: int,
+        data,
     ):
         """
-        Property: Filter includes ALL low confidence results
+        Property: Filter returns exactly the low confidence records, in order
         
-        Every result with confidence < 0.7 should appear in the filtered list.
+        Covers list-of-dict input on both the comprehension path and the
+        vectorized index path.
         """
-        # Create mock results
+        confidences = data.draw(
+            st.lists(
+                st.floats(min_value=0.0, max_value=1.0, allow_nan=False),
+                min_size=size,
+                max_size=size,
+            )
+        )
         results = [
-            {'id': str(uuid.uuid4()), 'confidence': c}
-            for c in confidences
+            dict(RESULT_TEMPLATES[i], confidence=c)
+            for i, c in enumerate(confidences)
         ]
         
-        # Apply filter
         filtered = filter_by_low_confidence(results)
-        filtered_ids = {r['id'] for r in filtered}
         
-        # Check that all low confidence results are included
-        for result in results:
-            if result['confidence'] < LOW_CONFIDENCE_THRESHOLD:
-                assert result['id'] in filtered_ids
-
-    @given(
-        confidences=st.lists(
-            st.floats(min_value=0.0, max_value=1.0, allow_nan=False),
-            min_size=0,
-            max_size=50,
-        ),
-    )
-    @settings(max_examples=100)
-    def test_filter_count_matches_low_confidence_count(
-        self,
-        confidences: List[float],
-    ):
-        """
-        Property: Filtered count equals low confidence count
-        
-        The number of filtered results should equal the number of
-        results with confidence < 0.7.
-        """
-        # Create mock results
-        results = [
-            {'id': str(uuid.uuid4()), 'confidence': c}
-            for c in confidences
+        assert result_ids(filtered).tolist() == [
+            i for i, c in enumerate(confidences) if c < LOW_CONFIDENCE_THRESHOLD
         ]
-        
-        # Apply filter
-        filtered = filter_by_low_confidence(results)
-        
-        # Count low confidence results manually
-        expected_count = sum(1 for c in confidences if c < LOW_CONFIDENCE_THRESHOLD)
-        
-        assert len(filtered) == expected_count
 
     @given(
         confidences=st.lists(
             st.floats(min_value=0.0, max_value=1.0, allow_nan=False),
             min_size=0,
-            max_size=50,
+            max_size=MAX_RESULTS,
         ),
     )
     @settings(max_examples=100)
@@ -324,12 +301,7 @@ class TestFilterCorrectnessProperties:
         """
         # Create mock results with additional data
         results = [
-            {
-                'id': str(uuid.uuid4()),
-                'confidence': c,
-                'comment_text': f'Comment {i}',
-                'is_gambling': i % 2 == 0,
-            }
+            dict(RESULT_TEMPLATES[i], confidence=c)
             for i, c in enumerate(confidences)
         ]
         
@@ -350,7 +322,7 @@ class TestFilterCorrectnessProperties:
         confidences=st.lists(
             st.floats(min_value=0.0, max_value=1.0, allow_nan=False),
             min_size=0,
-            max_size=50,
+            max_size=MAX_RESULTS,
         ),
     )
     @settings(max_examples=100)
@@ -366,8 +338,8 @@ class TestFilterCorrectnessProperties:
         """
         # Create mock results
         results = [
-            {'id': str(uuid.uuid4()), 'confidence': c}
-            for c in confidences
+            {'id': i, 'confidence': c}
+            for i, c in enumerate(confidences)
         ]
         
         # Apply filter once
@@ -379,15 +351,13 @@ class TestFilterCorrectnessProperties:
         # Results should be identical
         assert len(filtered_once) == len(filtered_twice)
         
-        once_ids = {r['id'] for r in filtered_once}
-        twice_ids = {r['id'] for r in filtered_twice}
-        assert once_ids == twice_ids
+        assert np.array_equal(result_ids(filtered_once), result_ids(filtered_twice))
 
     @given(
         confidences=st.lists(
             st.floats(min_value=0.0, max_value=1.0, allow_nan=False),
             min_size=0,
-            max_size=50,
+            max_size=MAX_RESULTS,
         ),
     )
     @settings(max_examples=100)
@@ -402,19 +372,17 @@ class TestFilterCorrectnessProperties:
         """
         # Create mock results
         results = [
-            {'id': str(uuid.uuid4()), 'confidence': c}
-            for c in confidences
+            {'id': i, 'confidence': c}
+            for i, c in enumerate(confidences)
         ]
         
         # Apply filter
         filtered = filter_by_low_confidence(results)
         
-        # Get IDs
-        original_ids = {r['id'] for r in results}
-        filtered_ids = {r['id'] for r in filtered}
-        
         # Filtered should be subset of original
-        assert filtered_ids.issubset(original_ids)
+        assert np.setdiff1d(
+            result_ids(filtered), result_ids(results), assume_unique=True
+        ).size == 0
 
     def test_empty_list_returns_empty(self):
         """
@@ -429,7 +397,7 @@ class TestFilterCorrectnessProperties:
     @given(
         confidence=st.floats(min_value=0.0, max_value=1.0, allow_nan=False),
     )
-    @settings(max_examples=100)
+    @FAST_SETTINGS
     def test_single_item_filter(
         self,
         confidence: float,
@@ -9,8 +9,98 @@ from hypothesis import given, strategies as st, settings, HealthCheck
 from fastapi.testclient import TestClient
 from prometheus_client import REGISTRY, CollectorRegistry
 from prometheus_client.parser import text_string_to_metric_families
+import functools
+import io
+import json
+import logging
 import re
 
+from app.logging_config import CustomJsonFormatter
+from app.main import app
+
+# Logger the request logging middleware writes to
+REQUESTS_LOGGER = logging.getLogger("app.requests")
+
+# Same format string the app configures for its JSON handler
+JSON_LOG_FORMAT = "%(timestamp)s %(level)s %(name)s %(message)s"
+
+# orjson is optional; its JSONDecodeError subclasses json.JSONDecodeError
+try:
+    from orjson import loads as loads_log_line
+except ImportError:
+    loads_log_line = json.loads
+
+# Matches the name of every label in Prometheus exposition text
+LABEL_NAME_PATTERN = re.compile(r'(\w+)="')
+
+# Byte pattern searched directly on the response body, skipping the decode
+STATUS_LABEL_PATTERN = re.compile(rb'status(_code)?="')
+
+
+@functools.lru_cache(maxsize=2)
+def _parse_metric_samples(metrics_text: str) -> tuple:
+    """Parse Prometheus exposition text into a tuple of samples."""
+    return tuple(
+        sample
+        for family in text_string_to_metric_families(metrics_text)
+        for sample in family.samples
+    )
+
+
+def metric_value(metrics_text: str, name: str, labels: dict) -> float:
+    """
+    Sum of the samples called ``name`` whose labels include ``labels``.
+    
+    Returns 0.0 when no sample matches, e.g. before the first request.
+    """
+    return sum(
+        sample.value
+        for sample in _parse_metric_samples(metrics_text)
+        if sample.name == name and labels.items() <= sample.labels.items()
+    )
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Test client shared by every test in this module."""
+    return TestClient(app)
+
+
+@pytest.fixture(scope="class")
+def log_capture():
+    """
+    Buffer receiving "app.requests" entries formatted like the app's logs.
+    
+    The handler and formatter are created once per class; tests truncate
+    the buffer before each request.
+    """
+    buffer = io.StringIO()
+    capture_handler = logging.StreamHandler(buffer)
+    capture_handler.setLevel(logging.DEBUG)
+    capture_handler.setFormatter(CustomJsonFormatter(fmt=JSON_LOG_FORMAT))
+    
+    REQUESTS_LOGGER.addHandler(capture_handler)
+    yield buffer
+    REQUESTS_LOGGER.removeHandler(capture_handler)
+
+
+@pytest.fixture
+def request_log_records(caplog, monkeypatch):
+    """
+    Capture records from the "app.requests" logger with caplog.
+    
+    The app disables propagation on that logger to avoid duplicate output,
+    so it is re-enabled for the test to let records reach caplog's handler.
+    Returns a callable giving the records logged so far.
+    """
+    monkeypatch.setattr(REQUESTS_LOGGER, "propagate", True)
+    caplog.set_level(logging.DEBUG, logger="app.requests")
+    
+    def records():
+        return [r for r in caplog.records if r.name == "app.requests"]
+    
+    return records
+
 
 class TestRequestMetricsRecording:
     """
@@ -22,13 +112,6 @@ class TestRequestMetricsRecording:
     matching the request's path and method.
     """
     
-    @pytest.fixture(autouse=True)
-    def setup_client(self):
-        """Set up test client for each test."""
-        # Import here to avoid circular imports and ensure fresh app state
-        from app.main import app
-        self.client = TestClient(app)
-    
     # Strategy for valid HTTP methods that the test client supports
     http_methods = st.sampled_from(["GET"])
     
@@ -43,20 +126,20 @@ class TestRequestMetricsRecording:
         method=http_methods
     )
     @settings(max_examples=100)
-    def test_request_metrics_include_method_and_path_labels(self, path: str, method: str):
+    def test_request_metrics_include_method_and_path_labels(self, client, path: str, method: str):
         """
         For any HTTP request, metrics SHALL include labels for method and path.
         """
         # Make the request
         if method == "GET":
-            response = self.client.get(path)
+            response = client.get(path)
         
         # Request should succeed (these are valid endpoints)
         assert response.status_code in [200, 401, 403, 404, 422], \
             f"Request to {method} {path} returned unexpected status {response.status_code}"
         
         # Fetch metrics
-        metrics_response = self.client.get("/metrics")
+        metrics_response = client.get("/metrics")
         assert metrics_response.status_code == 200, "Metrics endpoint should be accessible"
         
         metrics_text = metrics_response.text
@@ -66,8 +149,9 @@ class TestRequestMetricsRecording:
         # Check that we have HTTP request metrics with the expected labels
         
         # Look for http_request_duration_seconds or similar metrics with method label
-        has_method_label = 'method="' in metrics_text
-        has_handler_label = 'handler="' in metrics_text or 'path="' in metrics_text
+        label_names = set(LABEL_NAME_PATTERN.findall(metrics_text))
+        has_method_label = "method" in label_names
+        has_handler_label = "handler" in label_names or "path" in label_names
         
         assert has_method_label, \
             "Metrics should include 'method' label for HTTP requests"
@@ -78,42 +162,37 @@ class TestRequestMetricsRecording:
         num_requests=st.integers(min_value=1, max_value=5)
     )
     @settings(max_examples=50)
-    def test_request_count_increments_with_requests(self, num_requests: int):
+    def test_request_count_increments_with_requests(self, client, num_requests: int):
         """
         For any number of requests, the request counter SHALL increment accordingly.
         """
         # Get initial metrics
-        initial_metrics = self.client.get("/metrics")
+        initial_metrics = client.get("/metrics")
         assert initial_metrics.status_code == 200
         
         # Make multiple requests to health endpoint
         for _ in range(num_requests):
-            response = self.client.get("/health")
+            response = client.get("/health")
             assert response.status_code == 200
         
         # Get updated metrics
-        final_metrics = self.client.get("/metrics")
+        final_metrics = client.get("/metrics")
         assert final_metrics.status_code == 200
         
-        # Verify metrics contain request count data
-        # The exact metric name depends on the instrumentator configuration
-        metrics_text = final_metrics.text
-        
-        # Should have some form of request counter or histogram
-        has_request_metrics = (
-            "http_request" in metrics_text or 
-            "requests_total" in metrics_text or
-            "request_duration" in metrics_text
-        )
+        # The /health request counter should have grown by exactly num_requests
+        health_labels = {"handler": "/health", "method": "GET", "status": "200"}
+        initial_count = metric_value(initial_metrics.text, "http_requests_total", health_labels)
+        final_count = metric_value(final_metrics.text, "http_requests_total", health_labels)
         
-        assert has_request_metrics, \
-            "Metrics should contain HTTP request tracking metrics"
+        assert final_count - initial_count == num_requests, \
+            f"Request counter should increase by {num_requests}, " \
+            f"went from {initial_count} to {final_count}"
     
-    def test_metrics_endpoint_returns_prometheus_format(self):
+    def test_metrics_endpoint_returns_prometheus_format(self, client):
         """
         The /metrics endpoint SHALL return data in valid Prometheus text format.
         """
-        response = self.client.get("/metrics")
+        response = client.get("/metrics")
         
         assert response.status_code == 200, "Metrics endpoint should return 200"
         
@@ -129,37 +208,39 @@ class TestRequestMetricsRecording:
         # - Metric lines have format: metric_name{labels} value
         # - HELP and TYPE declarations
         
-        lines = metrics_text.strip().split("\n")
+        lines = metrics_text.splitlines()
         assert len(lines) > 0, "Metrics response should not be empty"
         
-        # Check for standard Prometheus format elements
-        has_help = any(line.startswith("# HELP") for line in lines)
-        has_type = any(line.startswith("# TYPE") for line in lines)
-        has_metrics = any(
-            not line.startswith("#") and line.strip() 
-            for line in lines
-        )
+        # Check for standard Prometheus format elements in a single pass
+        has_help = has_type = has_metrics = False
+        for line in lines:
+            if line.startswith("# HELP"):
+                has_help = True
+            elif line.startswith("# TYPE"):
+                has_type = True
+            elif line.strip() and not line.startswith("#"):
+                has_metrics = True
+            if has_help and has_type and has_metrics:
+                break
         
         assert has_help, "Metrics should include HELP declarations"
         assert has_type, "Metrics should include TYPE declarations"
         assert has_metrics, "Metrics should include actual metric values"
     
-    def test_metrics_include_status_code_labels(self):
+    def test_metrics_include_status_code_labels(self, client):
         """
         Request metrics SHALL include status code information.
         """
         # Make requests that return different status codes
-        self.client.get("/health")  # Should return 200
-        self.client.get("/nonexistent-path-12345")  # Should return 404
+        client.get("/health")  # Should return 200
+        client.get("/nonexistent-path-12345")  # Should return 404
         
         # Get metrics
-        metrics_response = self.client.get("/metrics")
+        metrics_response = client.get("/metrics")
         assert metrics_response.status_code == 200
         
-        metrics_text = metrics_response.text
-        
         # Check for status code labels in metrics
-        has_status_label = 'status="' in metrics_text or 'status_code="' in metrics_text
+        has_status_label = STATUS_LABEL_PATTERN.search(metrics_response.content) is not None
         
         assert has_status_label, \
             "Metrics should include status code labels for HTTP requests"
@@ -176,12 +257,6 @@ class TestStructuredLogCompleteness:
     path, and status_code fields.
     """
     
-    @pytest.fixture(autouse=True)
-    def setup_client(self):
-        """Set up test client for each test."""
-        from app.main import app
-        self.client = TestClient(app)
-    
     # Strategy for valid HTTP methods
     http_methods = st.sampled_from(["GET"])
     
@@ -196,7 +271,7 @@ class TestStructuredLogCompleteness:
         method=http_methods
     )
     @settings(max_examples=100)
-    def test_log_entry_contains_required_fields(self, path: str, method: str):
+    def test_log_entry_contains_required_fields(self, client, log_capture, path: str, method: str):
         """
         For any HTTP request, the log entry SHALL contain all required fields.
         
@@ -204,135 +279,102 @@ class TestStructuredLogCompleteness:
         (proving the middleware ran) and that the logging configuration produces
         valid JSON with required fields by using a custom log handler.
         """
-        import json
-        import logging
-        import io
-        
-        # Create a custom handler to capture log output
-        log_capture = io.StringIO()
-        capture_handler = logging.StreamHandler(log_capture)
-        capture_handler.setLevel(logging.DEBUG)
-        
-        # Get the requests logger and add our capture handler
-        requests_logger = logging.getLogger("app.requests")
-        original_handlers = requests_logger.handlers.copy()
-        
-        # Use the same formatter as the app
-        from app.logging_config import CustomJsonFormatter
-        formatter = CustomJsonFormatter(
-            fmt="%(timestamp)s %(level)s %(name)s %(message)s"
-        )
-        capture_handler.setFormatter(formatter)
-        requests_logger.addHandler(capture_handler)
+        # Start from an empty buffer for this example
+        log_capture.seek(0)
+        log_capture.truncate()
         
-        try:
-            # Make the request
-            if method == "GET":
-                response = self.client.get(path)
-            
-            # Verify request was processed (middleware ran)
-            assert "X-Request-ID" in response.headers, \
-                "Response should have X-Request-ID header from logging middleware"
-            
-            # Get captured log output
-            log_output = log_capture.getvalue()
-            
-            # Parse each line as JSON
-            log_lines = [line for line in log_output.strip().split("\n") if line]
+        # Make the request
+        if method == "GET":
+            response = client.get(path)
+        
+        # Verify request was processed (middleware ran)
+        assert "X-Request-ID" in response.headers, \
+            "Response should have X-Request-ID header from logging middleware"
+        
+        # Get captured log output
+        log_output = log_capture.getvalue()
+        
+        # Parse each line as JSON
+        log_lines = [line for line in log_output.strip().split("\n") if line]
+        
+        # Find request log entries (those with request_id)
+        request_logs = []
+        for line in log_lines:
+            try:
+                log_entry = loads_log_line(line)
+                if "request_id" in log_entry:
+                    request_logs.append(log_entry)
+            except json.JSONDecodeError:
+                continue
+        
+        # Should have at least one request log
+        assert len(request_logs) >= 1, \
+            f"Should have at least one request log entry, got {len(request_logs)}"
+        
+        # Verify each request log has required fields
+        for log_entry in request_logs:
+            # Check required fields exist
+            assert "timestamp" in log_entry, \
+                "Log entry must contain 'timestamp' field"
+            assert "request_id" in log_entry, \
+                "Log entry must contain 'request_id' field"
+            assert "method" in log_entry, \
+                "Log entry must contain 'method' field"
+            assert "path" in log_entry, \
+                "Log entry must contain 'path' field"
+            assert "status_code" in log_entry, \
+                "Log entry must contain 'status_code' field"
             
-            # Find request log entries (those with request_id)
-            request_logs = []
-            for line in log_lines:
-                try:
-                    log_entry = json.loads(line)
-                    if "request_id" in log_entry:
-                        request_logs.append(log_entry)
-                except json.JSONDecodeError:
-                    continue
+            # Verify field types
+            assert isinstance(log_entry["timestamp"], str), \
+                "timestamp must be a string"
+            assert isinstance(log_entry["request_id"], str), \
+                "request_id must be a string"
+            assert isinstance(log_entry["method"], str), \
+                "method must be a string"
+            assert isinstance(log_entry["path"], str), \
+                "path must be a string"
+            assert isinstance(log_entry["status_code"], int), \
+                "status_code must be an integer"
             
-            # Should have at least one request log
-            assert len(request_logs) >= 1, \
-                f"Should have at least one request log entry, got {len(request_logs)}"
+            # Verify method matches request
+            assert log_entry["method"] == method, \
+                f"Log method should match request method: {method}"
             
-            # Verify each request log has required fields
-            for log_entry in request_logs:
-                # Check required fields exist
-                assert "timestamp" in log_entry, \
-                    "Log entry must contain 'timestamp' field"
-                assert "request_id" in log_entry, \
-                    "Log entry must contain 'request_id' field"
-                assert "method" in log_entry, \
-                    "Log entry must contain 'method' field"
-                assert "path" in log_entry, \
-                    "Log entry must contain 'path' field"
-                assert "status_code" in log_entry, \
-                    "Log entry must contain 'status_code' field"
-                
-                # Verify field types
-                assert isinstance(log_entry["timestamp"], str), \
-                    "timestamp must be a string"
-                assert isinstance(log_entry["request_id"], str), \
-                    "request_id must be a string"
-                assert isinstance(log_entry["method"], str), \
-                    "method must be a string"
-                assert isinstance(log_entry["path"], str), \
-                    "path must be a string"
-                assert isinstance(log_entry["status_code"], int), \
-                    "status_code must be an integer"
-                
-                # Verify method matches request
-                assert log_entry["method"] == method, \
-                    f"Log method should match request method: {method}"
-                
-                # Verify path matches request
-                assert log_entry["path"] == path, \
-                    f"Log path should match request path: {path}"
-        finally:
-            # Clean up: remove our capture handler
-            requests_logger.removeHandler(capture_handler)
+            # Verify path matches request
+            assert log_entry["path"] == path, \
+                f"Log path should match request path: {path}"
     
-    def test_log_entry_is_valid_json(self, capsys):
+    def test_log_entry_is_valid_json(self, client, request_log_records):
         """
         Log entries SHALL be valid JSON format.
         """
-        import json
-        import io
-        import sys
-        
-        captured_output = io.StringIO()
-        old_stdout = sys.stdout
-        
-        try:
-            sys.stdout = captured_output
-            
-            # Make a request
-            response = self.client.get("/health")
-            
-            sys.stdout = old_stdout
-            
-            log_output = captured_output.getvalue()
-            log_lines = [line for line in log_output.strip().split("\n") if line]
-            
-            # Each non-empty line should be valid JSON
-            for line in log_lines:
-                try:
-                    parsed = json.loads(line)
-                    assert isinstance(parsed, dict), \
-                        "Log entry should be a JSON object"
-                except json.JSONDecodeError as e:
-                    pytest.fail(f"Log entry is not valid JSON: {line[:100]}... Error: {e}")
-                    
-        finally:
-            sys.stdout = old_stdout
+        formatter = CustomJsonFormatter(fmt=JSON_LOG_FORMAT)
+        
+        # Make a request
+        client.get("/health")
+        
+        records = request_log_records()
+        assert len(records) >= 1, "Request should emit at least one log entry"
+        
+        # Each formatted entry should be valid JSON
+        for record in records:
+            line = formatter.format(record)
+            try:
+                parsed = loads_log_line(line)
+                assert isinstance(parsed, dict), \
+                    "Log entry should be a JSON object"
+            except json.JSONDecodeError as e:
+                pytest.fail(f"Log entry is not valid JSON: {line[:100]}... Error: {e}")
     
-    def test_request_id_is_uuid_format(self):
+    def test_request_id_is_uuid_format(self, client):
         """
         The request_id SHALL be in UUID format.
         """
         import uuid
         
         # Make a request and check the X-Request-ID header
-        response = self.client.get("/health")
+        response = client.get("/health")
         
         request_id = response.headers.get("X-Request-ID")
         assert request_id is not None, "Response should have X-Request-ID header"
@@ -343,40 +385,24 @@ class TestStructuredLogCompleteness:
         except ValueError:
             pytest.fail(f"request_id is not a valid UUID: {request_id}")
     
-    def test_timestamp_is_iso8601_format(self, capsys):
+    def test_timestamp_is_iso8601_format(self, client, request_log_records):
         """
         The timestamp SHALL be in ISO 8601 format.
         """
-        import json
-        import io
-        import sys
         from datetime import datetime
         
-        captured_output = io.StringIO()
-        old_stdout = sys.stdout
+        formatter = CustomJsonFormatter(fmt=JSON_LOG_FORMAT)
         
-        try:
-            sys.stdout = captured_output
-            
-            response = self.client.get("/health")
-            
-            sys.stdout = old_stdout
-            
-            log_output = captured_output.getvalue()
-            log_lines = [line for line in log_output.strip().split("\n") if line]
-            
-            for line in log_lines:
-                try:
-                    log_entry = json.loads(line)
-                    if "timestamp" in log_entry:
-                        timestamp = log_entry["timestamp"]
-                        # Try to parse as ISO 8601
-                        try:
-                            datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                        except ValueError:
-                            pytest.fail(f"Timestamp is not ISO 8601 format: {timestamp}")
-                except json.JSONDecodeError:
-                    continue
-                    
-        finally:
-            sys.stdout = old_stdout
+        client.get("/health")
+        
+        records = request_log_records()
+        assert len(records) >= 1, "Request should emit at least one log entry"
+        
+        for record in records:
+            log_entry = loads_log_line(formatter.format(record))
+            timestamp = log_entry["timestamp"]
+            # Try to parse as ISO 8601
+            try:
+                datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+            except ValueError:
+                pytest.fail(f"Timestamp is not ISO 8601 format: {timestamp}")
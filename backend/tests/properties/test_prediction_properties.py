@@ -4,13 +4,48 @@ Property-based tests for the Prediction Service.
 Tests correctness properties for ML model predictions and serialization.
 """
 
+import json
+from unittest.mock import patch
+
 import pytest
 from hypothesis import given, strategies as st, settings
+from pydantic import TypeAdapter
 
 from app.services.prediction_service import PredictionService
 from app.schemas.prediction import PredictionResponse
 
+# orjson is optional; the stdlib codec round-trips floats just as exactly
+try:
+    from orjson import dumps as dumps_json, loads as loads_json
+except ImportError:
+    dumps_json, loads_json = json.dumps, json.loads
+
+# Built once so every round-trip reuses the same validator/serializer pair
+RESPONSE_ADAPTER = TypeAdapter(PredictionResponse)
+RESULTS_ADAPTER = TypeAdapter(list[PredictionResponse])
+
+# Printable ASCII keeps JSON encoding on its no-escape path; full Unicode
+# input is covered separately by test_unicode_text_is_preserved
+PRINTABLE_ASCII = st.characters(min_codepoint=0x20, max_codepoint=0x7E)
+
+# Hot properties skip per-example deadline timing and the example database;
+# max_examples still comes from the active profile. The slow native JSON
+# test keeps the profile defaults, database included
+HOT_SETTINGS = settings(deadline=None, derandomize=True, database=None)
+
+# Fields every prediction result must carry
+EXPECTED_KEYS = frozenset(("text", "is_gambling", "confidence"))
+
+
+def first_mismatch(actual: list, expected: list) -> int:
+    """Return the index of the first differing item (or the shorter length)."""
+    return next(
+        (i for i, (a, b) in enumerate(zip(actual, expected)) if a != b),
+        min(len(actual), len(expected)),
+    )
+
 
+@pytest.mark.xdist_group(name="pred_output")
 class TestPredictionOutputFormat:
     """
     **Feature: gambling-comment-detector, Property 3: Prediction Output Format and Bounds**
@@ -20,77 +55,70 @@ class TestPredictionOutputFormat:
     SHALL return a list of equal length where each prediction contains 
     is_gambling (boolean) and confidence (float between 0.0 and 1.0 inclusive).
     """
-    
+        
     @given(
-        text=st.text(min_size=1, max_size=500)
+        texts=st.lists(
+            st.text(alphabet=PRINTABLE_ASCII, min_size=1, max_size=500),
+            min_size=1,
+            max_size=64  # One forward pass covers the whole batch
+        )
     )
-    @settings(max_examples=100)
-    def test_single_prediction_output_format(self, text: str):
-        """Single prediction returns correct format with bounded confidence."""
-        service = PredictionService()
-        result = service.predict_single(text)
+    @HOT_SETTINGS
+    def test_batch_prediction_output_format(self, prediction_service: PredictionService, texts: list[str]):
+        """Batch prediction returns correct format with equal length output."""
+        results = prediction_service.predict_batch(texts)
+        
+        # Verify output length matches input
+        assert len(results) == len(texts), \
+            f"Output length ({len(results)}) must equal input length ({len(texts)})"
         
         # Verify output structure
-        assert "text" in result, "Result must contain 'text' field"
-        assert "is_gambling" in result, "Result must contain 'is_gambling' field"
-        assert "confidence" in result, "Result must contain 'confidence' field"
+        missing = [EXPECTED_KEYS - result.keys() for result in results if not EXPECTED_KEYS <= result.keys()]
+        assert not missing, f"Results missing keys: {missing}"
+        
+        # Verify types; strict validation rejects str/bool mismatches but
+        # still accepts an int for a float field, so confidence is checked
+        # explicitly below
+        RESULTS_ADAPTER.validate_python(results, strict=True)
         
-        # Verify types
-        assert isinstance(result["text"], str), "text must be a string"
-        assert isinstance(result["is_gambling"], bool), "is_gambling must be a boolean"
-        assert isinstance(result["confidence"], float), "confidence must be a float"
+        confidences = [result["confidence"] for result in results]
+        not_float = [c for c in confidences if not isinstance(c, float)]
+        assert not not_float, f"confidence must be a float, got {not_float}"
         
         # Verify confidence bounds
-        assert 0.0 <= result["confidence"] <= 1.0, \
-            f"confidence must be between 0.0 and 1.0, got {result['confidence']}"
+        assert 0.0 <= min(confidences) and max(confidences) <= 1.0, \
+            f"confidence must be between 0.0 and 1.0, got {confidences}"
         
         # Verify text is preserved
-        assert result["text"] == text, "Input text must be preserved in output"
+        # One C-level list compare; the index is only located on failure
+        out_texts = [result["text"] for result in results]
+        assert out_texts == texts, \
+            f"Result {first_mismatch(out_texts, texts)}: Input text must be preserved in output"
     
     @given(
-        texts=st.lists(
-            st.text(min_size=1, max_size=200),
-            min_size=1,
-            max_size=50  # Limited for test performance
-        )
+        texts=st.lists(st.text(min_size=1, max_size=100), min_size=1, max_size=8)
     )
-    @settings(max_examples=100)
-    def test_batch_prediction_output_format(self, texts: list[str]):
-        """Batch prediction returns correct format with equal length output."""
-        service = PredictionService()
-        results = service.predict_batch(texts)
-        
-        # Verify output length matches input
-        assert len(results) == len(texts), \
-            f"Output length ({len(results)}) must equal input length ({len(texts)})"
+    @settings(max_examples=10)
+    def test_unicode_text_is_preserved(self, prediction_service: PredictionService, texts: list[str]):
+        """Arbitrary Unicode input is classified and echoed back unchanged."""
+        results = prediction_service.predict_batch(texts)
         
-        # Verify each result
-        for i, (result, original_text) in enumerate(zip(results, texts)):
-            # Verify output structure
-            assert "text" in result, f"Result {i} must contain 'text' field"
-            assert "is_gambling" in result, f"Result {i} must contain 'is_gambling' field"
-            assert "confidence" in result, f"Result {i} must contain 'confidence' field"
-            
-            # Verify types
-            assert isinstance(result["text"], str), f"Result {i}: text must be a string"
-            assert isinstance(result["is_gambling"], bool), f"Result {i}: is_gambling must be a boolean"
-            assert isinstance(result["confidence"], float), f"Result {i}: confidence must be a float"
-            
-            # Verify confidence bounds
+        assert [result["text"] for result in results] == texts, \
+            "Input text must be preserved in output"
+        for result in results:
             assert 0.0 <= result["confidence"] <= 1.0, \
-                f"Result {i}: confidence must be between 0.0 and 1.0, got {result['confidence']}"
-            
-            # Verify text is preserved
-            assert result["text"] == original_text, \
-                f"Result {i}: Input text must be preserved in output"
+                f"confidence must be between 0.0 and 1.0, got {result['confidence']}"
     
     def test_empty_batch_returns_empty_list(self):
-        """Empty input list returns empty output list."""
-        service = PredictionService()
-        results = service.predict_batch([])
+        """Empty input list returns empty output list without touching the model."""
+        with patch.object(PredictionService, "load_model") as load_model:
+            results = PredictionService().predict_batch([])
+        
         assert results == [], "Empty input should return empty list"
+        load_model.assert_not_called()
 
 
+@pytest.mark.xdist_group(name="pred_serde")
 class TestPredictionSerializationRoundTrip:
     """
     **Feature: gambling-comment-detector, Property 4: Prediction Serialization Round-Trip**
@@ -99,17 +127,17 @@ class TestPredictionSerializationRoundTrip:
     For any PredictionResponse object, serializing to JSON and deserializing 
     back SHALL produce an equivalent object with identical field values.
     """
-    
+        
     @given(
-        text=st.text(min_size=0, max_size=500),
+        text=st.text(alphabet=PRINTABLE_ASCII, min_size=0, max_size=500),
         is_gambling=st.booleans(),
         confidence=st.floats(min_value=0.0, max_value=1.0, allow_nan=False, allow_infinity=False)
     )
-    @settings(max_examples=100)
+    @HOT_SETTINGS
     def test_prediction_response_serialization_roundtrip(
         self, text: str, is_gambling: bool, confidence: float
     ):
-        """PredictionResponse serializes to JSON and deserializes back correctly."""
+        """PredictionResponse field values survive a JSON dump/validate cycle."""
         # Create original response
         original = PredictionResponse(
             text=text,
@@ -117,26 +145,63 @@ class TestPredictionSerializationRoundTrip:
             confidence=confidence
         )
         
-        # Serialize to JSON
-        json_str = original.model_dump_json()
-        
-        # Deserialize back
-        restored = PredictionResponse.model_validate_json(json_str)
+        # Serialize to JSON and validate it back through the shared adapter
+        restored = RESPONSE_ADAPTER.validate_json(RESPONSE_ADAPTER.dump_json(original))
         
         # Verify round-trip consistency
         assert restored.text == original.text, "text must be preserved after round-trip"
         assert restored.is_gambling == original.is_gambling, "is_gambling must be preserved after round-trip"
-        assert abs(restored.confidence - original.confidence) < 1e-10, \
-            f"confidence must be preserved after round-trip (original: {original.confidence}, restored: {restored.confidence})"
+        assert restored.confidence == original.confidence, \
+            f"confidence changed: {original.confidence!r} -> {restored.confidence!r}"
+    
+    def test_prediction_response_json_roundtrip(self):
+        """PredictionResponse serializes to JSON and deserializes back correctly."""
+        originals = [
+            PredictionResponse(text="", is_gambling=False, confidence=0.0),
+            PredictionResponse(text="slot gacor maxwin 88", is_gambling=True, confidence=1.0),
+            PredictionResponse(text='quote " backslash \\ newline \n', is_gambling=False, confidence=0.1),
+            PredictionResponse(text="emoji 🎰 ünïcödé", is_gambling=True, confidence=0.5000000000000001),
+        ]
+        
+        for original in originals:
+            restored = RESPONSE_ADAPTER.validate_json(RESPONSE_ADAPTER.dump_json(original))
+            assert restored == original, f"round-trip changed {original!r} -> {restored!r}"
     
     @given(
-        text=st.text(min_size=1, max_size=200)
+        text=st.text(alphabet=PRINTABLE_ASCII, min_size=1, max_size=200)
     )
-    @settings(max_examples=100)
-    def test_prediction_service_output_serializes_correctly(self, text: str):
-        """Prediction service output can be serialized via PredictionResponse schema."""
-        service = PredictionService()
-        result = service.predict_single(text)
+    @HOT_SETTINGS
+    def test_prediction_service_output_serializes_correctly(
+        self, prediction_service: PredictionService, text: str
+    ):
+        """Prediction service output survives a JSON round-trip via PredictionResponse."""
+        result = prediction_service.predict_single(text)
+        
+        # Create PredictionResponse from service output
+        response = PredictionResponse(
+            text=result["text"],
+            is_gambling=result["is_gambling"],
+            confidence=result["confidence"]
+        )
+        
+        # Round-trip the field values through a plain JSON codec
+        restored = PredictionResponse.model_validate(loads_json(dumps_json(response.model_dump())))
+        
+        # Verify round-trip consistency
+        assert restored.text == result["text"]
+        assert restored.is_gambling == result["is_gambling"]
+        assert restored.confidence == result["confidence"], \
+            f"confidence changed: {result['confidence']!r} -> {restored.confidence!r}"
+    
+    @pytest.mark.slow
+    @given(
+        text=st.text(alphabet=PRINTABLE_ASCII, min_size=1, max_size=200)
+    )
+    def test_prediction_service_output_serializes_natively(
+        self, prediction_service: PredictionService, text: str
+    ):
+        """Prediction service output survives pydantic's own JSON serializer."""
+        result = prediction_service.predict_single(text)
         
         # Create PredictionResponse from service output
         response = PredictionResponse(
@@ -146,12 +211,13 @@ class TestPredictionSerializationRoundTrip:
         )
         
         # Serialize to JSON
-        json_str = response.model_dump_json()
+        json_bytes = RESPONSE_ADAPTER.dump_json(response)
         
         # Deserialize back
-        restored = PredictionResponse.model_validate_json(json_str)
+        restored = RESPONSE_ADAPTER.validate_json(json_bytes)
         
         # Verify round-trip consistency
         assert restored.text == result["text"]
         assert restored.is_gambling == result["is_gambling"]
-        assert abs(restored.confidence - result["confidence"]) < 1e-10
+        assert restored.confidence == result["confidence"], \
+            f"confidence changed: {result['confidence']!r} -> {restored.confidence!r}"
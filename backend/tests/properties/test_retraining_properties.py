@@ -18,11 +18,17 @@ from pathlib import Path
 # Add backend to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+import random
+import string
 import uuid
 import tempfile
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pandas as pd
 import pytest
 from hypothesis import given, strategies as st, settings, assume
@@ -35,14 +41,94 @@ from app.services.retraining_service import (
 
 
 # Strategies for generating test data
-comment_strategy = st.text(
-    min_size=1, 
-    max_size=200,
-    alphabet=st.characters(whitelist_categories=('L', 'N', 'P', 'S', 'Z'))
-).filter(lambda x: len(x.strip()) > 0)
+# Comments are opaque strings to the code under test, so an ASCII alphabet
+# gives the same coverage; a non-blank first character replaces the old
+# strip() filter, so no examples are rejected
+_COMMENT_ALPHABET = string.ascii_letters + string.digits + " .!?"
+comment_strategy = st.builds(
+    lambda head, tail: head + tail,
+    st.sampled_from(string.ascii_letters + string.digits),
+    st.text(alphabet=_COMMENT_ALPHABET, max_size=199),
+)
 
 label_strategy = st.booleans()
 
+# Fixed pool of comment texts for the list-heavy combination properties and
+# the model-lifecycle properties, which only need some valid input to predict
+# on. Drawing an index is far cheaper than generating Unicode text per
+# element, and the pool is small enough that duplicate comments still show
+# up often.
+_pool_rng = random.Random(0)
+_POOL_ALPHABET = string.ascii_letters + string.digits + string.punctuation + " éñü漢字🎰"
+COMMENT_POOL = tuple(
+    _pool_rng.choice(string.ascii_letters)
+    + "".join(_pool_rng.choices(_POOL_ALPHABET, k=_pool_rng.randint(0, 29)))
+    for _ in range(1000)
+)
+pooled_comment_strategy = st.sampled_from(COMMENT_POOL)
+
+# Threshold properties are plain integer comparisons: nothing to shrink and
+# nothing worth storing, so draw a fixed, small set of examples
+boundary_settings = settings(max_examples=20, derandomize=True, deadline=None, database=None)
+
+# Model-lifecycle properties share an in-memory example database
+fast_settings = settings.get_profile("fast")
+
+# Metric values and model version labels used by the model-lifecycle properties
+metric_value_strategy = st.floats(min_value=0.0, max_value=1.0, allow_nan=False)
+version_strategy = st.text(
+    min_size=1,
+    max_size=20,
+    alphabet=st.characters(whitelist_categories=('L', 'N'))
+).map(lambda x: f"v{x}")
+
+# Shared (comment, label) strategies, built once and reused by every property
+comment_label_strategy = st.tuples(pooled_comment_strategy, label_strategy)
+original_comments_strategy = st.lists(comment_label_strategy, min_size=5, max_size=20)
+unique_original_comments_strategy = st.lists(
+    comment_label_strategy, min_size=5, max_size=20, unique_by=lambda x: x[0]
+)
+validation_comments_strategy = st.lists(comment_label_strategy, min_size=0, max_size=10)
+nonempty_validation_comments_strategy = st.lists(comment_label_strategy, min_size=1, max_size=10)
+
+
+def _pairs_frame(pairs: list[tuple[str, bool]]) -> pd.DataFrame:
+    """Build a comment/label frame column-wise, with labels stored as int8."""
+    return pd.DataFrame({
+        'comment': [c for c, _ in pairs],
+        'label': np.fromiter((1 if l else 0 for _, l in pairs), dtype=np.int8, count=len(pairs)),
+    })
+
+
+def _combine(
+    original: Iterable[tuple[str, bool]],
+    validation: Iterable[tuple[str, bool]],
+) -> dict[str, int]:
+    """
+    Merge (comment, label) pairs the way get_training_data does.
+
+    Equivalent to concatenating both frames and dropping duplicate comments
+    with keep='last': later pairs overwrite earlier ones, so validation
+    labels win over original ones.
+    """
+    combined = {c: 1 if l else 0 for c, l in original}
+    combined.update((c, 1 if l else 0) for c, l in validation)
+    return combined
+
+
+# Deployment timestamps are only checked for presence, not ordering
+_FIXED_TS = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass(slots=True)
+class _MockModelVersion:
+    """Minimal stand-in for a model version record in deployment tests."""
+
+    version: str
+    is_active: bool = False
+    activated_at: datetime | None = None
+    deactivated_at: datetime | None = None
+
 
 class TestTrainingDataCombinationProperties:
     """
@@ -55,16 +141,8 @@ class TestTrainingDataCombinationProperties:
     """
 
     @given(
-        original_comments=st.lists(
-            st.tuples(comment_strategy, st.booleans()),
-            min_size=5,
-            max_size=20,
-        ),
-        validation_comments=st.lists(
-            st.tuples(comment_strategy, st.booleans()),
-            min_size=0,
-            max_size=10,
-        ),
+        original_comments=original_comments_strategy,
+        validation_comments=validation_comments_strategy,
     )
     @settings(max_examples=100)
     def test_combined_data_contains_all_original_comments(
@@ -78,50 +156,16 @@ class TestTrainingDataCombinationProperties:
         For any combination of original and validation data, all unique
         original comments should be present in the combined dataset.
         """
-        # Create original DataFrame
-        original_df = pd.DataFrame([
-            {'comment': c, 'label': 1 if l else 0}
-            for c, l in original_comments
-        ])
-        
-        # Create validation DataFrame
-        validation_df = pd.DataFrame([
-            {'comment': c, 'label': 1 if l else 0}
-            for c, l in validation_comments
-        ]) if validation_comments else pd.DataFrame(columns=['comment', 'label'])
-        
-        # Combine (simulating the service logic)
-        if len(validation_df) > 0:
-            combined_df = pd.concat([original_df, validation_df], ignore_index=True)
-        else:
-            combined_df = original_df.copy()
-        
-        # Remove duplicates keeping last (validation takes precedence)
-        combined_df = combined_df.drop_duplicates(subset=['comment'], keep='last')
-        
-        # Get unique original comments
-        original_unique = set(original_df['comment'].unique())
-        combined_comments = set(combined_df['comment'].values)
+        combined = _combine(original_comments, validation_comments)
         
-        # All original comments should be in combined (unless overwritten by validation)
-        # Actually, all unique comments from both should be present
-        all_input_comments = original_unique.union(
-            set(v[0] for v in validation_comments)
-        )
+        # All unique comments from both sources should be present
+        all_input_comments = {c for c, _ in original_comments} | {c for c, _ in validation_comments}
         
-        assert combined_comments == all_input_comments
+        assert combined.keys() == all_input_comments
 
     @given(
-        original_comments=st.lists(
-            st.tuples(comment_strategy, st.booleans()),
-            min_size=5,
-            max_size=20,
-        ),
-        validation_comments=st.lists(
-            st.tuples(comment_strategy, st.booleans()),
-            min_size=1,
-            max_size=10,
-        ),
+        original_comments=original_comments_strategy,
+        validation_comments=nonempty_validation_comments_strategy,
     )
     @settings(max_examples=100)
     def test_combined_data_contains_all_validation_comments(
@@ -135,39 +179,15 @@ class TestTrainingDataCombinationProperties:
         For any combination, all validation comments should be present
         in the combined dataset.
         """
-        # Create original DataFrame
-        original_df = pd.DataFrame([
-            {'comment': c, 'label': 1 if l else 0}
-            for c, l in original_comments
-        ])
-        
-        # Create validation DataFrame
-        validation_df = pd.DataFrame([
-            {'comment': c, 'label': 1 if l else 0}
-            for c, l in validation_comments
-        ])
-        
-        # Combine
-        combined_df = pd.concat([original_df, validation_df], ignore_index=True)
-        combined_df = combined_df.drop_duplicates(subset=['comment'], keep='last')
-        
-        combined_comments = set(combined_df['comment'].values)
-        validation_unique = set(v[0] for v in validation_comments)
+        combined = _combine(original_comments, validation_comments)
+        validation_unique = {c for c, _ in validation_comments}
         
         # All validation comments should be in combined
-        assert validation_unique.issubset(combined_comments)
+        assert validation_unique <= combined.keys()
 
     @given(
-        original_comments=st.lists(
-            st.tuples(comment_strategy, st.booleans()),
-            min_size=5,
-            max_size=20,
-        ),
-        validation_comments=st.lists(
-            st.tuples(comment_strategy, st.booleans()),
-            min_size=0,
-            max_size=10,
-        ),
+        original_comments=original_comments_strategy,
+        validation_comments=validation_comments_strategy,
     )
     @settings(max_examples=100)
     def test_combined_data_has_no_duplicates(
@@ -181,28 +201,17 @@ class TestTrainingDataCombinationProperties:
         For any combination, the resulting dataset should have no
         duplicate comment texts.
         """
-        # Create original DataFrame
-        original_df = pd.DataFrame([
-            {'comment': c, 'label': 1 if l else 0}
-            for c, l in original_comments
-        ])
-        
-        # Create validation DataFrame
-        validation_df = pd.DataFrame([
-            {'comment': c, 'label': 1 if l else 0}
-            for c, l in validation_comments
-        ]) if validation_comments else pd.DataFrame(columns=['comment', 'label'])
-        
-        # Combine
-        if len(validation_df) > 0:
-            combined_df = pd.concat([original_df, validation_df], ignore_index=True)
-        else:
-            combined_df = original_df.copy()
-        
+        # Build the frame the service deduplicates
+        combined_df = _pairs_frame(original_comments + validation_comments)
         combined_df = combined_df.drop_duplicates(subset=['comment'], keep='last')
         
         # Check no duplicates
-        assert len(combined_df) == len(combined_df['comment'].unique())
+        assert len(combined_df) == len(frozenset(combined_df['comment'].to_numpy(copy=False).tolist()))
+        
+        # The dict merge used by the other properties models this exactly
+        assert dict(zip(combined_df['comment'], combined_df['label'])) == _combine(
+            original_comments, validation_comments
+        )
 
     @given(
         shared_comment=comment_strategy,
@@ -222,34 +231,19 @@ class TestTrainingDataCombinationProperties:
         When a comment exists in both original and validation data,
         the validation label should be used (keep='last' behavior).
         """
-        # Create original DataFrame with the shared comment
-        original_df = pd.DataFrame([
-            {'comment': shared_comment, 'label': 1 if original_label else 0},
-            {'comment': 'other original comment', 'label': 0},
-        ])
-        
-        # Create validation DataFrame with the same comment but potentially different label
-        validation_df = pd.DataFrame([
-            {'comment': shared_comment, 'label': 1 if validation_label else 0},
-        ])
-        
-        # Combine (validation comes after original)
-        combined_df = pd.concat([original_df, validation_df], ignore_index=True)
-        combined_df = combined_df.drop_duplicates(subset=['comment'], keep='last')
-        
-        # Find the label for the shared comment
-        result_label = combined_df[combined_df['comment'] == shared_comment]['label'].iloc[0]
+        # Combine original pairs (with the shared comment) and the validation pair
+        combined = _combine(
+            [(shared_comment, original_label), ('other original comment', False)],
+            [(shared_comment, validation_label)],
+        )
         expected_label = 1 if validation_label else 0
         
         # Validation label should take precedence
-        assert result_label == expected_label
+        assert combined[shared_comment] == expected_label
 
     @given(
         validation_data=st.lists(
-            st.tuples(
-                comment_strategy,
-                st.booleans(),  # corrected_label (True=gambling, False=clean)
-            ),
+            comment_label_strategy,  # corrected_label (True=gambling, False=clean)
             min_size=1,
             max_size=20,
             unique_by=lambda x: x[0],  # Ensure unique comments to avoid ambiguity
@@ -267,20 +261,16 @@ class TestTrainingDataCombinationProperties:
         and corrected_label=False should map to label=0 (clean).
         """
         # Simulate the conversion logic from RetrainingService.get_training_data
-        converted_data = []
-        for comment, corrected_label in validation_data:
-            converted_data.append({
-                'comment': comment,
-                'label': 1 if corrected_label else 0,
-            })
-        
-        df = pd.DataFrame(converted_data)
+        df = _pairs_frame(validation_data)
+        label_map = dict(zip(
+            df['comment'].to_numpy(copy=False).tolist(),
+            df['label'].to_numpy(copy=False).tolist(),
+        ))
         
         # Verify conversion - each unique comment should have correct label
         for comment, corrected_label in validation_data:
-            row = df[df['comment'] == comment].iloc[0]
             expected_label = 1 if corrected_label else 0
-            assert row['label'] == expected_label
+            assert label_map[comment] == expected_label
 
     @given(
         original_size=st.integers(min_value=10, max_value=50),
@@ -300,29 +290,16 @@ class TestTrainingDataCombinationProperties:
         """
         # Generate unique comments for original
         original_comments = [f"original_comment_{i}" for i in range(original_size)]
-        original_df = pd.DataFrame([
-            {'comment': c, 'label': i % 2}
-            for i, c in enumerate(original_comments)
-        ])
         
         # Generate unique comments for validation (some may overlap)
         validation_comments = [f"validation_comment_{i}" for i in range(validation_size)]
-        validation_df = pd.DataFrame([
-            {'comment': c, 'label': i % 2}
-            for i, c in enumerate(validation_comments)
-        ]) if validation_size > 0 else pd.DataFrame(columns=['comment', 'label'])
-        
-        # Combine
-        if len(validation_df) > 0:
-            combined_df = pd.concat([original_df, validation_df], ignore_index=True)
-        else:
-            combined_df = original_df.copy()
         
-        combined_df = combined_df.drop_duplicates(subset=['comment'], keep='last')
+        # Only the cardinality matters, so combine as sets
+        combined_len = len(set(original_comments) | set(validation_comments))
         
         # Size bounds
-        assert len(combined_df) <= original_size + validation_size
-        assert len(combined_df) >= max(1, min(original_size, validation_size))
+        assert combined_len <= original_size + validation_size
+        assert combined_len >= max(1, min(original_size, validation_size))
 
 
 class TestRetrainingThresholdTriggerProperties:
@@ -334,113 +311,48 @@ class TestRetrainingThresholdTriggerProperties:
     the configured threshold, the system should trigger exactly one retraining job.
     """
 
-    @given(
-        pending_count=st.integers(min_value=0, max_value=200),
-        threshold=st.integers(min_value=1, max_value=150),
+    @pytest.mark.parametrize(
+        "pending_count,threshold,expected",
+        [
+            (0, 1, False),
+            (1, 1, True),
+            (0, 100, False),
+            (99, 100, False),   # one below the default threshold
+            (100, 100, True),   # exactly the default threshold
+            (101, 100, True),
+            (500, 100, True),
+            (999, 1000, False),
+            (1000, 1000, True),
+        ],
     )
-    @settings(max_examples=100)
-    def test_threshold_check_returns_true_when_reached(
+    def test_threshold_trigger_boundaries(
         self,
         pending_count: int,
         threshold: int,
+        expected: bool,
     ):
         """
-        Property: Threshold check returns True when pending >= threshold
+        Property: Retraining triggers exactly when pending >= threshold
         
-        For any pending count and threshold, check_retraining_threshold
-        should return True if and only if pending_count >= threshold.
+        Covers the default threshold (100) on both sides, the exact
+        threshold, and one below it for small and large thresholds.
         """
-        # Simulate the threshold check logic
-        should_trigger = pending_count >= threshold
-        
-        # This is the core logic from ValidationService.check_retraining_threshold
-        assert should_trigger == (pending_count >= threshold)
+        assert (pending_count >= threshold) == expected
 
-    @given(
-        pending_count=st.integers(min_value=0, max_value=99),
+    @pytest.mark.parametrize(
+        "initial_count,additions,before,after",
+        [
+            (50, 60, False, True),   # crosses the threshold
+            (10, 20, False, False),  # stays below
+            (150, 10, True, True),   # already above
+        ],
     )
-    @settings(max_examples=100)
-    def test_threshold_not_reached_with_default(
-        self,
-        pending_count: int,
-    ):
-        """
-        Property: Default threshold (100) not reached with fewer validations
-        
-        With the default threshold of 100, any pending count < 100
-        should not trigger retraining.
-        """
-        default_threshold = 100
-        should_trigger = pending_count >= default_threshold
-        
-        assert should_trigger == False
-
-    @given(
-        pending_count=st.integers(min_value=100, max_value=500),
-    )
-    @settings(max_examples=100)
-    def test_threshold_reached_with_default(
-        self,
-        pending_count: int,
-    ):
-        """
-        Property: Default threshold (100) reached with sufficient validations
-        
-        With the default threshold of 100, any pending count >= 100
-        should trigger retraining.
-        """
-        default_threshold = 100
-        should_trigger = pending_count >= default_threshold
-        
-        assert should_trigger == True
-
-    @given(
-        threshold=st.integers(min_value=1, max_value=1000),
-    )
-    @settings(max_examples=100)
-    def test_exact_threshold_triggers_retraining(
-        self,
-        threshold: int,
-    ):
-        """
-        Property: Exact threshold count triggers retraining
-        
-        When pending count equals exactly the threshold,
-        retraining should be triggered.
-        """
-        pending_count = threshold
-        should_trigger = pending_count >= threshold
-        
-        assert should_trigger == True
-
-    @given(
-        threshold=st.integers(min_value=2, max_value=1000),
-    )
-    @settings(max_examples=100)
-    def test_one_below_threshold_does_not_trigger(
-        self,
-        threshold: int,
-    ):
-        """
-        Property: One below threshold does not trigger retraining
-        
-        When pending count is exactly one less than threshold,
-        retraining should not be triggered.
-        """
-        pending_count = threshold - 1
-        should_trigger = pending_count >= threshold
-        
-        assert should_trigger == False
-
-    @given(
-        initial_count=st.integers(min_value=0, max_value=98),
-        additions=st.integers(min_value=1, max_value=50),
-    )
-    @settings(max_examples=100)
     def test_threshold_crossing_detection(
         self,
         initial_count: int,
         additions: int,
+        before: bool,
+        after: bool,
     ):
         """
         Property: Threshold crossing is correctly detected
@@ -450,55 +362,13 @@ class TestRetrainingThresholdTriggerProperties:
         """
         threshold = 100
         
-        # Before additions
-        before_trigger = initial_count >= threshold
-        
-        # After additions
-        final_count = initial_count + additions
-        after_trigger = final_count >= threshold
-        
-        # If we crossed the threshold
-        if initial_count < threshold <= final_count:
-            assert before_trigger == False
-            assert after_trigger == True
-        elif final_count < threshold:
-            assert after_trigger == False
-        else:
-            # Both were already above threshold
-            assert before_trigger == True
-            assert after_trigger == True
+        assert (initial_count >= threshold) == before
+        assert (initial_count + additions >= threshold) == after
 
-    @given(
-        pending_count=st.integers(min_value=0, max_value=300),
-        threshold=st.integers(min_value=1, max_value=200),
+    @pytest.mark.parametrize(
+        "pending_count,threshold",
+        [(0, 1), (99, 100), (100, 100), (101, 100)],
     )
-    @settings(max_examples=100)
-    def test_threshold_trigger_is_idempotent(
-        self,
-        pending_count: int,
-        threshold: int,
-    ):
-        """
-        Property: Threshold trigger check is idempotent
-        
-        For any given pending count and threshold, calling the threshold
-        check multiple times should always return the same result.
-        This ensures exactly one retraining job would be triggered
-        (not multiple) for the same state.
-        """
-        # Check multiple times
-        result1 = pending_count >= threshold
-        result2 = pending_count >= threshold
-        result3 = pending_count >= threshold
-        
-        # All results should be identical
-        assert result1 == result2 == result3
-
-    @given(
-        pending_count=st.integers(min_value=0, max_value=500),
-        threshold=st.integers(min_value=1, max_value=300),
-    )
-    @settings(max_examples=100)
     def test_threshold_trigger_monotonicity(
         self,
         pending_count: int,
@@ -513,20 +383,14 @@ class TestRetrainingThresholdTriggerProperties:
         """
         should_trigger = pending_count >= threshold
         
-        # If triggered, adding more should still trigger
         if should_trigger:
-            for additional in range(1, 10):
-                assert (pending_count + additional) >= threshold
-        
-        # If not triggered, removing should still not trigger
-        if not should_trigger and pending_count > 0:
-            for less in range(1, min(pending_count + 1, 10)):
-                assert (pending_count - less) < threshold
+            # If triggered, one more validation should still trigger
+            assert (pending_count + 1) >= threshold
+        else:
+            # If not triggered, one fewer should still not trigger
+            assert (pending_count - 1) < threshold
 
-    @given(
-        threshold=st.integers(min_value=1, max_value=500),
-    )
-    @settings(max_examples=100)
+    @pytest.mark.parametrize("threshold", [1, 2, 100, 999])
     def test_threshold_boundary_precision(
         self,
         threshold: int,
@@ -558,7 +422,7 @@ class TestRetrainingThresholdTriggerProperties:
         ),
         threshold=st.integers(min_value=1, max_value=150),
     )
-    @settings(max_examples=100)
+    @boundary_settings
     def test_only_unused_validations_count_toward_threshold(
         self,
         num_validations: list[bool],
@@ -577,14 +441,9 @@ class TestRetrainingThresholdTriggerProperties:
         # Threshold check should only consider unused
         should_trigger = unused_count >= threshold
         
-        # Verify the logic
-        assert should_trigger == (unused_count >= threshold)
-        
-        # Total count should not affect the decision
-        total_count = len(num_validations)
-        # Even if total >= threshold, if unused < threshold, should not trigger
-        if unused_count < threshold:
-            assert should_trigger == False
+        # Adding already-used validations must not change the decision
+        with_used = num_validations + [True] * threshold
+        assert (sum(1 for used in with_used if not used) >= threshold) == should_trigger
 
 
 class TestTrainingDataCombinationIntegrationProperties:
@@ -601,12 +460,7 @@ class TestTrainingDataCombinationIntegrationProperties:
     """
 
     @given(
-        original_comments=st.lists(
-            st.tuples(comment_strategy, st.booleans()),
-            min_size=5,
-            max_size=20,
-            unique_by=lambda x: x[0],
-        ),
+        original_comments=unique_original_comments_strategy,
         validation_feedback=st.lists(
             st.tuples(
                 comment_strategy,
@@ -631,12 +485,6 @@ class TestTrainingDataCombinationIntegrationProperties:
         used_in_training=False should be included in the combined dataset.
         This validates Requirements 9.3.
         """
-        # Create original DataFrame
-        original_df = pd.DataFrame([
-            {'comment': c, 'label': 1 if l else 0}
-            for c, l in original_comments
-        ])
-        
         # Separate used and unused validation feedback
         unused_validations = [
             (comment, label) 
@@ -649,25 +497,12 @@ class TestTrainingDataCombinationIntegrationProperties:
             if used  # used_in_training=True means already used
         ]
         
-        # Create validation DataFrame (only unused)
-        validation_df = pd.DataFrame([
-            {'comment': c, 'label': 1 if l else 0}
-            for c, l in unused_validations
-        ]) if unused_validations else pd.DataFrame(columns=['comment', 'label'])
-        
-        # Combine (simulating get_training_data logic)
-        if len(validation_df) > 0:
-            combined_df = pd.concat([original_df, validation_df], ignore_index=True)
-        else:
-            combined_df = original_df.copy()
-        
-        combined_df = combined_df.drop_duplicates(subset=['comment'], keep='last')
-        
-        combined_comments = set(combined_df['comment'].values)
+        # Combine (only unused feedback reaches get_training_data)
+        combined = _combine(original_comments, unused_validations)
         
         # All unused validation comments should be in combined
         unused_comments = set(c for c, _ in unused_validations)
-        assert unused_comments.issubset(combined_comments)
+        assert unused_comments <= combined.keys()
         
         # Used validation comments should NOT be in combined (unless in original)
         original_comment_set = set(c for c, _ in original_comments)
@@ -675,21 +510,12 @@ class TestTrainingDataCombinationIntegrationProperties:
         used_only_comments = used_comments - original_comment_set - unused_comments
         
         # Comments that are ONLY in used validations should not appear
-        for comment in used_only_comments:
-            assert comment not in combined_comments
+        assert used_only_comments.isdisjoint(combined.keys())
 
     @given(
-        original_comments=st.lists(
-            st.tuples(comment_strategy, st.booleans()),
-            min_size=5,
-            max_size=20,
-            unique_by=lambda x: x[0],
-        ),
+        original_comments=unique_original_comments_strategy,
         validation_feedback=st.lists(
-            st.tuples(
-                comment_strategy,
-                st.booleans(),  # corrected_label
-            ),
+            comment_label_strategy,  # corrected_label
             min_size=1,
             max_size=15,
             unique_by=lambda x: x[0],
@@ -708,31 +534,15 @@ class TestTrainingDataCombinationIntegrationProperties:
         should contain exactly the union of unique comments from both sources.
         This validates Requirements 6.3.
         """
-        # Create original DataFrame
-        original_df = pd.DataFrame([
-            {'comment': c, 'label': 1 if l else 0}
-            for c, l in original_comments
-        ])
-        
-        # Create validation DataFrame
-        validation_df = pd.DataFrame([
-            {'comment': c, 'label': 1 if l else 0}
-            for c, l in validation_feedback
-        ])
-        
-        # Combine
-        combined_df = pd.concat([original_df, validation_df], ignore_index=True)
-        combined_df = combined_df.drop_duplicates(subset=['comment'], keep='last')
+        combined = _combine(original_comments, validation_feedback)
         
         # Calculate expected union
         original_set = set(c for c, _ in original_comments)
         validation_set = set(c for c, _ in validation_feedback)
         expected_union = original_set.union(validation_set)
         
-        combined_set = set(combined_df['comment'].values)
-        
         # Combined should equal the union
-        assert combined_set == expected_union
+        assert combined.keys() == expected_union
 
     @given(
         shared_comments=st.lists(
@@ -754,28 +564,17 @@ class TestTrainingDataCombinationIntegrationProperties:
         the final label should be from the validation feedback (user correction).
         This validates Requirements 6.3, 9.3.
         """
-        # Create original DataFrame with one label
-        original_df = pd.DataFrame([
-            {'comment': c, 'label': 1 if orig_label else 0}
-            for c, orig_label, _ in shared_comments
-        ])
-        
-        # Create validation DataFrame with potentially different label
-        validation_df = pd.DataFrame([
-            {'comment': c, 'label': 1 if val_label else 0}
-            for c, _, val_label in shared_comments
-        ])
-        
         # Combine (validation comes after original, keep='last')
-        combined_df = pd.concat([original_df, validation_df], ignore_index=True)
-        combined_df = combined_df.drop_duplicates(subset=['comment'], keep='last')
+        combined = _combine(
+            ((c, orig_label) for c, orig_label, _ in shared_comments),
+            ((c, val_label) for c, _, val_label in shared_comments),
+        )
         
-        # Verify each comment has the validation label
+        # Verify each comment appears once, with the validation label
+        assert len(combined) == len(shared_comments)
         for comment, _, val_label in shared_comments:
-            row = combined_df[combined_df['comment'] == comment]
-            assert len(row) == 1
             expected_label = 1 if val_label else 0
-            assert row['label'].iloc[0] == expected_label
+            assert combined[comment] == expected_label
 
     @given(
         original_size=st.integers(min_value=10, max_value=100),
@@ -811,29 +610,13 @@ class TestTrainingDataCombinationIntegrationProperties:
         for i in range(validation_size - overlap_count):
             validation_comments.append(f"validation_{i}")
         
-        # Create DataFrames
-        original_df = pd.DataFrame([
-            {'comment': c, 'label': 0}
-            for c in original_comments
-        ])
-        
-        validation_df = pd.DataFrame([
-            {'comment': c, 'label': 1}
-            for c in validation_comments
-        ]) if validation_comments else pd.DataFrame(columns=['comment', 'label'])
-        
-        # Combine
-        if len(validation_df) > 0:
-            combined_df = pd.concat([original_df, validation_df], ignore_index=True)
-        else:
-            combined_df = original_df.copy()
-        
-        combined_df = combined_df.drop_duplicates(subset=['comment'], keep='last')
+        # Only the cardinality matters, so combine as sets
+        combined_len = len(set(original_comments) | set(validation_comments))
         
         # Expected size: original + validation - overlap
         expected_size = original_size + validation_size - overlap_count
         
-        assert len(combined_df) == expected_size
+        assert combined_len == expected_size
 
 
 class TestModelMetricsProperties:
@@ -842,14 +625,14 @@ class TestModelMetricsProperties:
     """
 
     @given(
-        accuracy=st.floats(min_value=0.0, max_value=1.0, allow_nan=False),
-        precision=st.floats(min_value=0.0, max_value=1.0, allow_nan=False),
-        recall=st.floats(min_value=0.0, max_value=1.0, allow_nan=False),
-        f1=st.floats(min_value=0.0, max_value=1.0, allow_nan=False),
+        accuracy=metric_value_strategy,
+        precision=metric_value_strategy,
+        recall=metric_value_strategy,
+        f1=metric_value_strategy,
         training_samples=st.integers(min_value=1, max_value=100000),
         validation_samples=st.integers(min_value=0, max_value=10000),
     )
-    @settings(max_examples=100)
+    @settings(max_examples=20, derandomize=True, database=None)
     def test_model_metrics_stores_values_correctly(
         self,
         accuracy: float,
@@ -882,14 +665,14 @@ class TestModelMetricsProperties:
         assert metrics.validation_samples == validation_samples
 
     @given(
-        accuracy=st.floats(min_value=0.0, max_value=1.0, allow_nan=False),
-        precision=st.floats(min_value=0.0, max_value=1.0, allow_nan=False),
-        recall=st.floats(min_value=0.0, max_value=1.0, allow_nan=False),
-        f1=st.floats(min_value=0.0, max_value=1.0, allow_nan=False),
+        accuracy=metric_value_strategy,
+        precision=metric_value_strategy,
+        recall=metric_value_strategy,
+        f1=metric_value_strategy,
         training_samples=st.integers(min_value=1, max_value=100000),
         validation_samples=st.integers(min_value=0, max_value=10000),
     )
-    @settings(max_examples=100)
+    @settings(max_examples=20, derandomize=True, database=None)
     def test_model_metrics_to_dict_contains_all_fields(
         self,
         accuracy: float,
@@ -931,6 +714,46 @@ class TestModelMetricsProperties:
         assert result['validation_samples'] == validation_samples
 
 
+def _model_snapshot():
+    """
+    Read PredictionService's current model without taking the model lock.
+
+    Reloads swap the model with a single reference assignment, which is
+    atomic under the GIL, so a bare attribute read never sees a torn value.
+    """
+    from app.services.prediction_service import PredictionService
+
+    return PredictionService._model
+
+
+@pytest.fixture(scope="module")
+def loaded_model():
+    """
+    Load the prediction model once for every model-lifecycle property.
+
+    Individual examples read and swap PredictionService's class-level model,
+    so a fresh load per example only repeated the joblib deserialization.
+    Under pytest-xdist each worker process loads its own copy; the model
+    state lives in class attributes guarded by an in-process lock, so
+    workers never contend with each other.
+    Skips every dependent test up front when the model file is unavailable.
+    """
+    from app.services.prediction_service import ModelLoadError, PredictionService
+
+    PredictionService.reset_model()
+    try:
+        PredictionService.load_model()
+    except ModelLoadError as e:
+        pytest.skip(f"model file unavailable: {e}")
+    yield
+    PredictionService.reset_model()
+
+
+# Shared worker threads for concurrent prediction tests
+_POOL = ThreadPoolExecutor(max_workers=2)
+
+
+@pytest.mark.usefixtures("loaded_model")
 class TestModelContinuityDuringRetrainingProperties:
     """
     **Feature: auto-ml-retraining, Property 7: Model Continuity During Retraining**
@@ -942,14 +765,15 @@ class TestModelContinuityDuringRetrainingProperties:
 
     @given(
         test_texts=st.lists(
-            comment_strategy,
+            pooled_comment_strategy,
             min_size=1,
             max_size=10,
         ),
     )
-    @settings(max_examples=100)
+    @settings(fast_settings, max_examples=100)
     def test_predictions_available_during_reload_flag(
         self,
+        prediction_service,
         test_texts: list[str],
     ):
         """
@@ -961,19 +785,6 @@ class TestModelContinuityDuringRetrainingProperties:
         """
         from app.services.prediction_service import PredictionService
         
-        # Simulate reload in progress state
-        # The service should still serve predictions from the current model
-        
-        # Reset to ensure clean state
-        PredictionService.reset_model()
-        
-        # Load initial model
-        try:
-            PredictionService.load_model()
-        except Exception:
-            # Skip if model file not available in test environment
-            return
-        
         # Set reload flag (simulating retraining in progress)
         with PredictionService._model_lock:
             original_flag = PredictionService._is_reloading
@@ -981,10 +792,9 @@ class TestModelContinuityDuringRetrainingProperties:
         
         try:
             # Predictions should still work
-            service = PredictionService()
-            for text in test_texts:
-                result = service.predict_single(text)
-                
+            results = prediction_service.predict_batch(test_texts)
+            assert len(results) == len(test_texts)
+            for result in results:
                 # Verify prediction structure is valid
                 assert 'text' in result
                 assert 'is_gambling' in result
@@ -998,14 +808,15 @@ class TestModelContinuityDuringRetrainingProperties:
 
     @given(
         test_texts=st.lists(
-            comment_strategy,
+            pooled_comment_strategy,
             min_size=1,
             max_size=5,
         ),
     )
-    @settings(max_examples=100)
+    @settings(fast_settings, max_examples=100)
     def test_model_reference_stable_during_prediction(
         self,
+        prediction_service,
         test_texts: list[str],
     ):
         """
@@ -1014,42 +825,31 @@ class TestModelContinuityDuringRetrainingProperties:
         For any prediction request, the model used should be consistent
         throughout the entire prediction (no mid-prediction swap).
         """
-        from app.services.prediction_service import PredictionService
-        
-        # Reset to ensure clean state
-        PredictionService.reset_model()
-        
-        try:
-            PredictionService.load_model()
-        except Exception:
-            # Skip if model file not available
-            return
-        
-        service = PredictionService()
-        
         # Get model reference before prediction
-        with PredictionService._model_lock:
-            model_before = PredictionService._model
+        model_before = _model_snapshot()
         
         # Make predictions
-        for text in test_texts:
-            result = service.predict_single(text)
-            assert result is not None
+        results = prediction_service.predict_batch(test_texts)
+        assert len(results) == len(test_texts)
+        assert all(result is not None for result in results)
         
         # Model reference should be the same (no unexpected swap)
-        with PredictionService._model_lock:
-            model_after = PredictionService._model
+        model_after = _model_snapshot()
         
         # In absence of explicit reload, model should be same object
         assert model_before is model_after
 
     @given(
-        batch_size=st.integers(min_value=1, max_value=20),
+        texts=st.builds(
+            lambda n: [f"t{i}" for i in range(n)],
+            st.integers(min_value=1, max_value=20),
+        ),
     )
-    @settings(max_examples=100)
+    @settings(fast_settings, max_examples=100)
     def test_batch_predictions_complete_atomically(
         self,
-        batch_size: int,
+        prediction_service,
+        texts: list[str],
     ):
         """
         Property: Batch predictions complete atomically
@@ -1057,26 +857,11 @@ class TestModelContinuityDuringRetrainingProperties:
         For any batch prediction request, all predictions in the batch
         should use the same model version (atomic batch processing).
         """
-        from app.services.prediction_service import PredictionService
-        
-        # Reset to ensure clean state
-        PredictionService.reset_model()
-        
-        try:
-            PredictionService.load_model()
-        except Exception:
-            return
-        
-        # Generate test texts
-        texts = [f"test comment number {i}" for i in range(batch_size)]
-        
-        service = PredictionService()
-        
         # Batch prediction should complete fully
-        results = service.predict_batch(texts)
+        results = prediction_service.predict_batch(texts)
         
         # All results should be present
-        assert len(results) == batch_size
+        assert len(results) == len(texts)
         
         # All results should have valid structure
         for i, result in enumerate(results):
@@ -1087,9 +872,10 @@ class TestModelContinuityDuringRetrainingProperties:
     @given(
         num_predictions=st.integers(min_value=1, max_value=10),
     )
-    @settings(max_examples=100)
+    @settings(fast_settings, max_examples=100)
     def test_concurrent_reload_does_not_block_predictions(
         self,
+        prediction_service,
         num_predictions: int,
     ):
         """
@@ -1099,34 +885,22 @@ class TestModelContinuityDuringRetrainingProperties:
         while predictions are in progress, predictions should complete
         without being blocked.
         """
-        import threading
-        import time
         from app.services.prediction_service import PredictionService
         
-        # Reset to ensure clean state
-        PredictionService.reset_model()
-        
-        try:
-            PredictionService.load_model()
-        except Exception:
-            return
-        
-        service = PredictionService()
         prediction_results = []
         prediction_errors = []
         
         def make_predictions():
-            """Make predictions in a separate thread."""
+            """Make predictions on a pool worker thread."""
             try:
                 for i in range(num_predictions):
-                    result = service.predict_single(f"test text {i}")
+                    result = prediction_service.predict_single(f"test text {i}")
                     prediction_results.append(result)
             except Exception as e:
                 prediction_errors.append(e)
         
-        # Start prediction thread
-        pred_thread = threading.Thread(target=make_predictions)
-        pred_thread.start()
+        # Start predictions on a pool worker
+        fut = _POOL.submit(make_predictions)
         
         # Attempt reload while predictions are running
         # This should not block or fail the predictions
@@ -1134,7 +908,7 @@ class TestModelContinuityDuringRetrainingProperties:
         PredictionService.reload_model()
         
         # Wait for predictions to complete
-        pred_thread.join(timeout=10)
+        fut.result(timeout=10)
         
         # Predictions should have completed without errors
         assert len(prediction_errors) == 0
@@ -1151,13 +925,9 @@ class TestModelSwapOnSuccessProperties:
     """
 
     @given(
-        version_string=st.text(
-            min_size=1,
-            max_size=20,
-            alphabet=st.characters(whitelist_categories=('L', 'N'))
-        ).map(lambda x: f"v{x}"),
+        version_string=version_strategy,
     )
-    @settings(max_examples=100)
+    @settings(fast_settings, max_examples=100)
     def test_new_model_becomes_active_after_deployment(
         self,
         version_string: str,
@@ -1171,31 +941,22 @@ class TestModelSwapOnSuccessProperties:
         # This tests the deployment logic conceptually
         # In actual deployment, the new model's is_active should be True
         
-        # Simulate the deployment state transition
-        class MockModelVersion:
-            def __init__(self, version: str, is_active: bool = False):
-                self.version = version
-                self.is_active = is_active
-                self.activated_at = None
-                self.deactivated_at = None
-        
         # Before deployment
-        new_model = MockModelVersion(version_string, is_active=False)
+        new_model = _MockModelVersion(version_string, is_active=False)
         
         # Simulate successful deployment
-        from datetime import datetime, timezone
         new_model.is_active = True
-        new_model.activated_at = datetime.now(timezone.utc)
+        new_model.activated_at = _FIXED_TS
         
         # After deployment, new model should be active
         assert new_model.is_active == True
         assert new_model.activated_at is not None
 
     @given(
-        old_version=st.text(min_size=1, max_size=10, alphabet=st.characters(whitelist_categories=('L', 'N'))).map(lambda x: f"v{x}_old"),
-        new_version=st.text(min_size=1, max_size=10, alphabet=st.characters(whitelist_categories=('L', 'N'))).map(lambda x: f"v{x}_new"),
+        old_version=version_strategy.map(lambda v: f"{v}_old"),
+        new_version=version_strategy.map(lambda v: f"{v}_new"),
     )
-    @settings(max_examples=100)
+    @settings(fast_settings, max_examples=100)
     def test_previous_model_deactivated_on_new_deployment(
         self,
         old_version: str,
@@ -1207,27 +968,18 @@ class TestModelSwapOnSuccessProperties:
         For any successful deployment, the previously active model
         should have is_active=False and deactivated_at set.
         """
-        from datetime import datetime, timezone
-        
-        class MockModelVersion:
-            def __init__(self, version: str, is_active: bool = False):
-                self.version = version
-                self.is_active = is_active
-                self.activated_at = None
-                self.deactivated_at = None
-        
         # Setup: old model is active
-        old_model = MockModelVersion(old_version, is_active=True)
-        old_model.activated_at = datetime.now(timezone.utc)
+        old_model = _MockModelVersion(old_version, is_active=True)
+        old_model.activated_at = _FIXED_TS
         
-        new_model = MockModelVersion(new_version, is_active=False)
+        new_model = _MockModelVersion(new_version, is_active=False)
         
         # Simulate deployment: deactivate old, activate new
         old_model.is_active = False
-        old_model.deactivated_at = datetime.now(timezone.utc)
+        old_model.deactivated_at = _FIXED_TS
         
         new_model.is_active = True
-        new_model.activated_at = datetime.now(timezone.utc)
+        new_model.activated_at = _FIXED_TS
         
         # Verify state
         assert old_model.is_active == False
@@ -1237,7 +989,7 @@ class TestModelSwapOnSuccessProperties:
     @given(
         num_versions=st.integers(min_value=2, max_value=5),
     )
-    @settings(max_examples=100)
+    @settings(fast_settings, max_examples=100)
     def test_only_one_model_active_at_a_time(
         self,
         num_versions: int,
@@ -1248,35 +1000,24 @@ class TestModelSwapOnSuccessProperties:
         For any number of model versions, exactly one should be active
         after any deployment operation.
         """
-        from datetime import datetime, timezone
-        
-        class MockModelVersion:
-            def __init__(self, version: str, is_active: bool = False):
-                self.version = version
-                self.is_active = is_active
-        
-        # Create multiple versions
-        versions = [MockModelVersion(f"v{i}", is_active=False) for i in range(num_versions)]
+        # Only the is_active bit matters here, one flag per version
+        active = np.zeros(num_versions, dtype=bool)
         
         # Simulate deploying each version in sequence
-        for i, version in enumerate(versions):
-            # Deactivate all others
-            for v in versions:
-                v.is_active = False
-            
-            # Activate current
-            version.is_active = True
+        for i in range(num_versions):
+            # Deactivate all others, then activate current
+            active[:] = False
+            active[i] = True
             
             # Verify exactly one is active
-            active_count = sum(1 for v in versions if v.is_active)
-            assert active_count == 1
-            assert version.is_active == True
+            assert active.sum() == 1
+            assert active[i]
 
     @given(
-        accuracy=st.floats(min_value=0.0, max_value=1.0, allow_nan=False),
-        f1=st.floats(min_value=0.0, max_value=1.0, allow_nan=False),
+        accuracy=metric_value_strategy,
+        f1=metric_value_strategy,
     )
-    @settings(max_examples=100)
+    @settings(max_examples=20, derandomize=True, database=None)
     def test_model_metrics_preserved_after_deployment(
         self,
         accuracy: float,
@@ -1315,6 +1056,7 @@ class TestModelSwapOnSuccessProperties:
         assert model_version.f1_score == f1
 
 
+@pytest.mark.usefixtures("loaded_model")
 class TestModelPreservationOnFailureProperties:
     """
     **Feature: auto-ml-retraining, Property 9: Model Preservation on Failure**
@@ -1324,16 +1066,37 @@ class TestModelPreservationOnFailureProperties:
     active and unchanged.
     """
 
+    @pytest.fixture(scope="class")
+    def failed_reload(self, loaded_model):
+        """
+        Attempt one failing reload.
+
+        Returns the model active before the attempt and reload_model's
+        result; the test asserts on both so a regression fails the property
+        rather than erroring the fixture.
+        """
+        from app.services.prediction_service import PredictionService
+        from pathlib import Path
+
+        model_ref = _model_snapshot()
+
+        # Reload target is constant, so the failing attempt only needs to run once
+        result = PredictionService.reload_model(Path("/nonexistent/model.joblib"))
+
+        return model_ref, result
+
     @given(
         test_texts=st.lists(
-            comment_strategy,
+            pooled_comment_strategy,
             min_size=1,
             max_size=5,
         ),
     )
-    @settings(max_examples=100)
+    @settings(fast_settings, max_examples=100)
     def test_model_unchanged_after_failed_reload(
         self,
+        prediction_service,
+        failed_reload,
         test_texts: list[str],
     ):
         """
@@ -1342,92 +1105,50 @@ class TestModelPreservationOnFailureProperties:
         For any failed reload attempt (e.g., file not found), the current
         model should continue to be used for predictions.
         """
-        from app.services.prediction_service import PredictionService
-        from pathlib import Path
-        
-        # Reset and load initial model
-        PredictionService.reset_model()
-        
-        try:
-            PredictionService.load_model()
-        except Exception:
-            return
-        
-        # Get predictions before failed reload
-        service = PredictionService()
-        predictions_before = [service.predict_single(t) for t in test_texts]
-        
-        # Get model reference before
-        with PredictionService._model_lock:
-            model_before = PredictionService._model
-        
-        # Attempt reload with non-existent file (should fail)
-        result = PredictionService.reload_model(Path("/nonexistent/model.joblib"))
+        model_before, result = failed_reload
         
         # Reload should have failed
-        assert result == False
+        assert result is False
         
         # Model should be unchanged
-        with PredictionService._model_lock:
-            model_after = PredictionService._model
-        
-        assert model_before is model_after
+        assert _model_snapshot() is model_before
         
-        # Predictions should still work and be consistent
-        predictions_after = [service.predict_single(t) for t in test_texts]
+        # Predictions should still work and be deterministic: predict every
+        # text twice in one batch and compare the two halves
+        n = len(test_texts)
+        results = prediction_service.predict_batch(test_texts + test_texts)
+        assert len(results) == 2 * n
         
-        for before, after in zip(predictions_before, predictions_after):
-            assert before['is_gambling'] == after['is_gambling']
-            assert before['confidence'] == after['confidence']
+        for first, second in zip(results[:n], results[n:]):
+            assert first['is_gambling'] == second['is_gambling']
+            assert first['confidence'] == second['confidence']
 
-    @given(
-        num_failed_attempts=st.integers(min_value=1, max_value=5),
-    )
-    @settings(max_examples=100)
-    def test_model_stable_after_multiple_failed_reloads(
-        self,
-        num_failed_attempts: int,
-    ):
+    def test_model_stable_after_multiple_failed_reloads(self):
         """
         Property: Model remains stable after multiple failed reload attempts
         
-        For any number of failed reload attempts, the model should remain
-        the same and continue serving predictions.
+        After each of several consecutive failed reload attempts, the active
+        model should remain the same object. A failing
+        reload is a cheap missing-file check, so a fixed run of attempts
+        covers the property without generated inputs.
         """
         from app.services.prediction_service import PredictionService
         from pathlib import Path
         
-        # Reset and load initial model
-        PredictionService.reset_model()
-        
-        try:
-            PredictionService.load_model()
-        except Exception:
-            return
-        
         # Get initial model reference
-        with PredictionService._model_lock:
-            initial_model = PredictionService._model
+        initial_model = _model_snapshot()
         
-        # Attempt multiple failed reloads
-        for i in range(num_failed_attempts):
+        for i in range(5):
             result = PredictionService.reload_model(Path(f"/nonexistent/model_{i}.joblib"))
-            assert result == False
-        
-        # Model should still be the initial one
-        with PredictionService._model_lock:
-            current_model = PredictionService._model
-        
-        assert initial_model is current_model
+            assert result is False
+            
+            # Model should still be the initial one after every attempt
+            assert _model_snapshot() is initial_model
 
     @given(
-        version_string=st.text(
-            min_size=1,
-            max_size=10,
-            alphabet=st.characters(whitelist_categories=('L', 'N'))
-        ).map(lambda x: f"v{x}"),
+        version_string=version_strategy,
     )
-    @settings(max_examples=100)
+    @settings(fast_settings, max_examples=100)
     def test_active_model_version_unchanged_on_deployment_failure(
         self,
         version_string: str,
@@ -1438,18 +1159,9 @@ class TestModelPreservationOnFailureProperties:
         For any failed deployment attempt, the currently active model
         version in the database should remain active.
         """
-        from datetime import datetime, timezone
-        
-        class MockModelVersion:
-            def __init__(self, version: str, is_active: bool = False):
-                self.version = version
-                self.is_active = is_active
-                self.activated_at = None
-                self.deactivated_at = None
-        
         # Setup: current model is active
-        current_model = MockModelVersion("v_current", is_active=True)
-        current_model.activated_at = datetime.now(timezone.utc)
+        current_model = _MockModelVersion("v_current", is_active=True)
+        current_model.activated_at = _FIXED_TS
         
         # Simulate failed deployment (exception during save)
         deployment_failed = True
@@ -1464,11 +1176,12 @@ class TestModelPreservationOnFailureProperties:
         assert current_model.deactivated_at is None
 
     @given(
-        test_text=comment_strategy,
+        test_text=pooled_comment_strategy,
     )
-    @settings(max_examples=100)
+    @settings(fast_settings, max_examples=100)
     def test_predictions_continue_after_training_failure(
         self,
+        prediction_service,
         test_text: str,
     ):
         """
@@ -1477,41 +1190,14 @@ class TestModelPreservationOnFailureProperties:
         For any training failure scenario, the prediction service should
         continue to serve predictions using the existing model.
         """
-        from app.services.prediction_service import PredictionService
-        
-        # Reset and load initial model
-        PredictionService.reset_model()
-        
-        try:
-            PredictionService.load_model()
-        except Exception:
-            return
-        
-        service = PredictionService()
-        
-        # Get prediction before simulated failure
-        result_before = service.predict_single(test_text)
-        
-        # Simulate training failure (model not swapped)
-        # In real scenario, retrain_model task would catch exception
-        # and not call reload_model
-        training_succeeded = False
-        
-        if not training_succeeded:
-            # No reload happens
-            pass
-        
-        # Predictions should still work
-        result_after = service.predict_single(test_text)
+        # A failed training run never calls reload_model, so the existing
+        # model keeps serving and repeated predictions must agree
+        results = prediction_service.predict_batch([test_text, test_text])
         
         # Results should be identical (same model)
-        assert result_before['is_gambling'] == result_after['is_gambling']
-        assert result_before['confidence'] == result_after['confidence']
+        assert results[0] == results[1]
 
-    @given(
-        error_type=st.sampled_from(['file_not_found', 'corrupted_file', 'permission_denied']),
-    )
-    @settings(max_examples=100)
+    @pytest.mark.parametrize("error_type", ['file_not_found', 'corrupted_file', 'permission_denied'])
     def test_model_preserved_for_various_failure_types(
         self,
         error_type: str,
@@ -1526,17 +1212,8 @@ class TestModelPreservationOnFailureProperties:
         from app.services.prediction_service import PredictionService
         from pathlib import Path
         
-        # Reset and load initial model
-        PredictionService.reset_model()
-        
-        try:
-            PredictionService.load_model()
-        except Exception:
-            return
-        
         # Get initial model
-        with PredictionService._model_lock:
-            initial_model = PredictionService._model
+        initial_model = _model_snapshot()
         
         # Simulate different failure scenarios
         if error_type == 'file_not_found':
@@ -1552,7 +1229,6 @@ class TestModelPreservationOnFailureProperties:
         assert result == False
         
         # Model should be preserved
-        with PredictionService._model_lock:
-            current_model = PredictionService._model
+        current_model = _model_snapshot()
         
         assert initial_model is current_model